@@ -45,18 +45,26 @@ osascript/zenity dialogs) with Python equivalents for full Windows compatibility
 from __future__ import annotations
 
 # Standard library imports
+import atexit  # Cleanup at interpreter exit
+import codecs  # Incremental text decoding
 import datetime as dt  # Date and time handling
+import functools  # Memoization helpers
 import getpass  # User name retrieval
+import io  # Core stream tools
 import os  # Operating system interface
 import platform  # Platform detection
+import queue  # Hand-off of log file writes to the writer thread
 import re  # Regular expressions
 import shutil  # High-level file operations
-import shlex  # Shell-like syntax parsing
+import stat  # File mode tests
 import subprocess  # Subprocess management
 import sys  # System-specific parameters and functions
+import threading  # Background log file writer
+from collections import defaultdict  # Menu templates with missing setup keys
+from concurrent.futures import ThreadPoolExecutor  # Concurrent PATH scans, file copies and startup probes
 from dataclasses import dataclass, field  # Data class definitions
 from pathlib import Path  # Object-oriented filesystem paths
-from typing import Optional  # Type hints
+from typing import Callable, Iterable, Optional, Sequence  # Type hints
 
 
 def getch() -> str:
@@ -81,8 +89,12 @@ def getch() -> str:
 
 VERSION = "1.3.0"
 
+# Slotted dataclasses (Python 3.10+) avoid a per-instance __dict__; older
+# Pythons fall back to regular dataclasses.
+_DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class AppState:
     """Holds script state and mirrors the Bash global variables."""
 
@@ -99,6 +111,7 @@ class AppState:
     desc: str = ""  # Description for profile (usually same as name)
     action: str = ""  # Current action code from main menu
     profile_folder: str = ""  # Folder where profile is created/saved
+    profile_folder_resolved: str = ""  # Resolved profile_folder (os.getcwd() after changing into it)
     new_name: str = ""  # New name for renamed files/profiles
     ti3_mtime_before: str = ""  # Modification time before resuming measurement
     ti3_mtime_after: str = ""  # Modification time after measurement
@@ -109,6 +122,20 @@ class AppState:
     inst_arg: str = ""  # Instrument argument for Argyll commands
     inst_name: str = ""  # Human-readable instrument name
 
+    # Folders from the setup file, resolved against script_dir once per main menu iteration
+    created_profiles_dir: Optional[Path] = None  # CREATED_PROFILES_FOLDER
+    pre_made_targets_dir: Optional[Path] = None  # PRE_MADE_TARGETS_FOLDER
+    target_cfg: Optional[TargetCfg] = None  # Setup values for target generation, see make_target_cfg()
+    # Target size menu entries from the setup file, see build_selection_table()
+    selections: dict[tuple[str, str, int], dict[str, str]] = field(default_factory=dict)
+    # ICC profile paths from the setup file -> resolved path (None if not a file), see resolve_profile_path()
+    resolved_icc_paths: dict[str, Optional[str]] = field(default_factory=dict)
+    # Split COMMON_ARGUMENTS_* values from the setup file, see build_common_args()
+    common_args: dict[str, tuple[str, ...]] = field(default_factory=dict)
+    # (st_mtime_ns, st_size) of the setup file the values above were built from
+    setup_stamp: Optional[tuple[int, int]] = None
+    setup_warnings: list[str] = field(default_factory=list)  # validate_cfg_paths() output for setup_stamp
+
 
 
 class TeeLogger:
@@ -123,23 +150,95 @@ class TeeLogger:
 
     def __init__(self, log_path: Path) -> None:
         self.log_path = log_path  # Path to the log file to write to
+        # Keep one buffered binary append handle open for the logger's lifetime
+        # (create if needed) instead of reopening the file on every write.
+        self._fh = log_path.open("ab", buffering=1 << 15)
+        # Log file writes are queued and done by a background thread, so long menu
+        # and report dumps do not wait on the disk. None in the queue stops the thread.
+        self._queue: queue.Queue[Optional[bytes]] = queue.Queue()
+        self._writer = threading.Thread(target=self._write_queued, name="TeeLogger", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+        # When the terminal is UTF-8 with plain "\n" newlines, the encoded bytes
+        # can be shared with it; otherwise stdout keeps its own text encoding.
+        encoding = (getattr(sys.stdout, "encoding", None) or "").lower().replace("-", "").replace("_", "")
+        self._stdout_bytes = getattr(sys.stdout, "buffer", None) if encoding == "utf8" and os.linesep == "\n" else None
+
+    def _write_queued(self) -> None:
+        # Writer thread: take everything queued so far and write it as one batch
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._fh.writelines(data for data in batch if data is not None)
+            except (OSError, ValueError):
+                pass  # A failing log file must not stall the interactive session
+            for _ in batch:
+                self._queue.task_done()
+            if None in batch:
+                return
+
+    def _encode(self, text: str) -> bytes:
+        # Encode once for the log file, with the platform's line endings
+        if os.linesep != "\n":
+            text = text.replace("\n", os.linesep)
+        return text.encode("utf-8", errors="replace")
 
     def write(self, text: str) -> None:
+        data = self._encode(text)
         # Write text to stdout and flush immediately
-        sys.stdout.write(text)
-        sys.stdout.flush()
-        # Append text to the log file (create if needed)
-        with self.log_path.open("a", encoding="utf-8", errors="replace") as f:
-            f.write(text)
+        if self._stdout_bytes is not None:
+            sys.stdout.flush()  # Keep ordering with print() output in the text layer
+            self._stdout_bytes.write(data)
+            self._stdout_bytes.flush()
+        else:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        # Append text to the log file via the writer thread (flushed by flush()/close())
+        self._queue.put(data)
 
     def writeln(self, text: str = "") -> None:
         # Write a line with newline
         self.write(text + "\n")
 
+    def write_block(self, lines: Iterable[str]) -> None:
+        # Write several lines with one terminal and one file write
+        self.write("\n".join(lines) + "\n")
+
     def log_only(self, text: str = "") -> None:
         # Write to log file only, not to stdout
-        with self.log_path.open("a", encoding="utf-8", errors="replace") as f:
-            f.write(text + "\n")
+        self._queue.put(self._encode(text + "\n"))
+
+    def flush(self) -> None:
+        # Push buffered output to the terminal and the log file
+        sys.stdout.flush()
+        self._flush_log_file()
+
+    def prompt(self, text: str) -> None:
+        # Show a key prompt on the terminal only (not logged). The log file is
+        # flushed first, so it is complete while waiting for the user; the prompt
+        # has no newline, so pending terminal output and the prompt go out in one flush.
+        self._flush_log_file()
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+    def _flush_log_file(self) -> None:
+        if self._writer.is_alive():
+            self._queue.join()
+        if not self._fh.closed:
+            self._fh.flush()
+
+    def close(self) -> None:
+        # Stop the writer thread, then flush and close the log file (registered with atexit)
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        if not self._fh.closed:
+            self._fh.close()
 
 
 def detect_platform() -> str:
@@ -177,11 +276,19 @@ def session_separator(state: AppState, log: TeeLogger) -> None:
         "",
         "",
     ]
-    for line in lines:
-        log.log_only(line)
+    log.log_only("\n".join(lines))
+
 
+# One sweep over the whole file: KEY=value lines (leading whitespace allowed),
+# with the value stopping before a best-effort inline comment " # ...".
+_SETUP_ASSIGN_RE = re.compile(
+    r"^[ \t]*(?P<key>[A-Za-z_][A-Za-z0-9_]*)=(?P<val>.*?)(?: #.*)?$",
+    re.MULTILINE,
+)
 
-_SETUP_ASSIGN_RE = re.compile(r"^(?P<key>[A-Za-z_][A-Za-z0-9_]*)=(?P<val>.*)$")
+# Parsed setup files keyed by (path, st_mtime_ns, st_size), so an unchanged
+# file is only parsed once per session even though the menus reload it often.
+_SETUP_CACHE: dict[tuple[str, int, int], dict[str, str]] = {}
 
 
 def load_setup_file_shell_style(setup_path: Path) -> dict[str, str]:
@@ -194,132 +301,319 @@ def load_setup_file_shell_style(setup_path: Path) -> dict[str, str]:
     variable names.
     """
 
-    if not setup_path.exists():
-        raise FileNotFoundError(f"Setup file not found: {setup_path}")
+    try:
+        st = setup_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Setup file not found: {setup_path}") from None
+
+    key = (str(setup_path), st.st_mtime_ns, st.st_size)
+    cached = _SETUP_CACHE.get(key)
+    if cached is not None:
+        # Callers mutate the returned dict, so never hand out the cached one
+        return cached.copy()
+
+    text = setup_path.read_text(encoding="utf-8", errors="replace")
+    cfg: dict[str, str] = {
+        m.group("key"): _strip_quotes(m.group("val").strip())
+        for m in _SETUP_ASSIGN_RE.finditer(text)
+    }
 
-    cfg: dict[str, str] = {}
-    for raw_line in setup_path.read_text(encoding="utf-8", errors="replace").splitlines():
-        line = raw_line.strip()
-        if not line or line.startswith("#"):
-            continue
+    _evict_setup_cache(setup_path)
+    _SETUP_CACHE[key] = dict(cfg)
+    return cfg
 
-        m = _SETUP_ASSIGN_RE.match(line)
-        if not m:
-            continue
 
-        key = m.group("key")
-        val = m.group("val").strip()
+def _strip_quotes(val: str) -> str:
+    """Strip matching outer single or double quotes, if present."""
 
-        # Best-effort stripping of inline comments " # ...".
-        if " #" in val:
-            val = val.split(" #", 1)[0].rstrip()
+    if len(val) >= 2 and val[0] == val[-1] and val[0] in "'\"":
+        return val[1:-1]
+    return val
 
-        # Strip outer quotes if present
-        if (val.startswith("'") and val.endswith("'")) or (val.startswith('"') and val.endswith('"')):
-            val = val[1:-1]
 
-        cfg[key] = val
+def _evict_setup_cache(setup_path: Path) -> None:
+    """Drop cached parse results for setup_path (e.g. after it was rewritten)."""
 
-    return cfg
+    path_str = str(setup_path)
+    for cache_key in [k for k in _SETUP_CACHE if k[0] == path_str]:
+        del _SETUP_CACHE[cache_key]
 
 
 def update_setup_value_shell_style(setup_path: Path, key: str, value: str) -> None:
     """Update or append KEY='value' in the shell-style setup file."""
 
-    lines = setup_path.read_text(encoding="utf-8", errors="replace").splitlines(keepends=False)
-    out: list[str] = []
-    found = False
-    key_prefix = f"{key}="
+    text = setup_path.read_text(encoding="utf-8", errors="replace")
+    new_line = f"{key}='{value}'"
 
-    for line in lines:
-        if line.strip().startswith(key_prefix):
-            out.append(f"{key}='{value}'")
-            found = True
-        else:
-            out.append(line)
+    # Replace every assignment of key in one pass (the loader keeps the last
+    # one, so duplicates must be updated too). A callable replacement keeps
+    # backslashes in values (e.g. Windows paths) literal.
+    pattern = re.compile(rf"^[ \t]*{re.escape(key)}=.*$", re.MULTILINE)
+    text, n = pattern.subn(lambda _m: new_line, text)
+
+    if text and not text.endswith("\n"):
+        text += "\n"
+    if n == 0:
+        text += new_line + "\n"
+
+    # Write a temp file next to the real one (following a symlinked setup file)
+    # and swap it in atomically, so a crash never leaves a half-written setup.
+    target = Path(os.path.realpath(setup_path))
+    tmp = target.with_suffix(target.suffix + ".tmp")
+    try:
+        tmp.write_bytes(text.replace("\n", os.linesep).encode("utf-8"))
+        try:
+            shutil.copymode(target, tmp)
+        except OSError:
+            pass
+        os.replace(tmp, target)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+    finally:
+        _evict_setup_cache(setup_path)
+
+
+# Resolved PATH lookups per tuple of command names, so repeated checks are free
+_WHICH_CACHE: dict[tuple[str, ...], list[Optional[str]]] = {}
+# Command name -> candidate paths in PATH order, built from one scan of PATH
+_PATH_INDEX: Optional[dict[str, list[str]]] = None
+
+
+def _scan_path_dir(directory: str) -> list[tuple[str, str]]:
+    """List (name, path) for every entry of one PATH directory."""
+
+    try:
+        with os.scandir(directory) as it:
+            return [(entry.name, entry.path) for entry in it]
+    except OSError:
+        return []
 
-    if not found:
-        out.append(f"{key}='{value}'")
 
-    setup_path.write_text("\n".join(out) + "\n", encoding="utf-8")
+def _path_index() -> dict[str, list[str]]:
+    """Index all PATH directories once per process (memoized).
 
+    Each directory is read a single time, independent of how many commands are
+    looked up. On Windows, names are also indexed without their PATHEXT suffix.
+    """
 
-def check_required_commands(required_cmds: list[str], log: TeeLogger, PLATFORM: str) -> None:
+    global _PATH_INDEX
+    if _PATH_INDEX is None:
+        dirs = list(dict.fromkeys(d for d in os.environ.get("PATH", os.defpath).split(os.pathsep) if d))
+        pathext: set[str] = set()
+        if sys.platform == "win32":
+            pathext = {e.lower() for e in os.environ.get("PATHEXT", ".COM;.EXE;.BAT;.CMD").split(os.pathsep) if e}
+
+        index: dict[str, list[str]] = {}
+        # Directory reads release the GIL, so scan them concurrently; map()
+        # keeps PATH order, which decides which match wins.
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(dirs)))) as ex:
+            for entries in ex.map(_scan_path_dir, dirs):
+                for name, path in entries:
+                    name = os.path.normcase(name)
+                    index.setdefault(name, []).append(path)
+                    stem, ext = os.path.splitext(name)
+                    if ext in pathext:
+                        index.setdefault(stem, []).append(path)
+        _PATH_INDEX = index
+    return _PATH_INDEX
+
+
+def _which_all(cmds: Sequence[str]) -> list[Optional[str]]:
+    """Resolve several commands on PATH (like shutil.which per command)."""
+
+    key = tuple(cmds)
+    if key not in _WHICH_CACHE:
+        index = _path_index()
+        resolved: list[Optional[str]] = []
+        for cmd in cmds:
+            if os.path.dirname(cmd):
+                resolved.append(shutil.which(cmd))  # Explicit path, not a PATH lookup
+                continue
+            # Only the candidates of requested names are stat'ed
+            candidates = index.get(os.path.normcase(cmd), [])
+            resolved.append(
+                next((p for p in candidates if os.path.isfile(p) and os.access(p, os.X_OK)), None)
+            )
+        _WHICH_CACHE[key] = resolved
+    return _WHICH_CACHE[key]
+
+
+# ArgyllCMS tools the workflow runs
+_ARGYLL_CMDS: tuple[str, ...] = ("targen", "chartread", "colprof", "printtarg", "profcheck", "dispcal")
+_ARGYLL_CMDS_SET = frozenset(_ARGYLL_CMDS)
+
+# Install hints for missing prerequisites: topic -> platform -> message
+_PLATFORM_HINTS: dict[str, dict[str, str]] = {
+    "argyll": {
+        "linux": "On Linux, install ArgyllCMS with: sudo apt update && sudo apt install argyll",
+        "macos": "On macOS, install ArgyllCMS with: brew install argyllcms",
+        "windows": "On Windows, download and install ArgyllCMS from https://www.argyllcms.com/",
+    },
+    "tkinter": {
+        "linux": "On Linux, install tkinter with: sudo apt update && sudo apt install python3-tk",
+        "macos": "On macOS, tkinter is usually included with Python. Try reinstalling Python from python.org or use Homebrew: brew install python-tk",
+        "windows": "On Windows, tkinter is included with Python installations from python.org. Download and install Python again, ensuring tkinter is selected during installation.",
+    },
+}
+
+
+def check_required_commands(required_cmds: Sequence[str], log: TeeLogger, PLATFORM: str) -> None:
     """Check that required external commands are available on PATH."""
 
-    missing = [cmd for cmd in required_cmds if shutil.which(cmd) is None]
+    resolved = _which_all(required_cmds)
+    missing = [cmd for cmd, path in zip(required_cmds, resolved) if path is None]
     if missing:
         log.writeln(f"❌ Missing required commands: {', '.join(missing)}")
-        for cmd in missing:
-            if cmd in ["targen", "chartread", "colprof", "printtarg", "profcheck", "dispcal"]:
-                if PLATFORM == "linux":
-                    log.writeln("On Linux, install ArgyllCMS with: sudo apt update && sudo apt install argyll")
-                elif PLATFORM == "macos":
-                    log.writeln("On macOS, install ArgyllCMS with: brew install argyllcms")
-                elif PLATFORM == "windows":
-                    log.writeln("On Windows, download and install ArgyllCMS from https://www.argyllcms.com/")
-                break  # Only show once for Argyll tools
+        # Only show once for Argyll tools
+        if not _ARGYLL_CMDS_SET.isdisjoint(missing):
+            hint = _PLATFORM_HINTS["argyll"].get(PLATFORM)
+            if hint:
+                log.writeln(hint)
         raise SystemExit(1)
 
 
+_RUN_CMD_CHUNK_SIZE = 1 << 16  # Read size for external command output
+_RUN_CMD_PIPE_BUFSIZE = 1 << 17  # Buffer on the command's output pipe
+
+
 def run_cmd(args: list[str], log: TeeLogger, cwd: Optional[Path] = None) -> int:
     """Run external command and stream combined stdout/stderr to logger."""
 
     log.writeln("")
     log.writeln(f"Command Used: {' '.join(args)}")
 
-    # Stream output line-by-line so it goes to both terminal and log.
+    # Stream output in chunks so it goes to both terminal and log.
     try:
         proc = subprocess.Popen(
             args,
             cwd=str(cwd) if cwd else None,
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
+            bufsize=_RUN_CMD_PIPE_BUFSIZE,
         )
     except FileNotFoundError:
         log.writeln(f"❌ Command not found: {args[0]}")
         return 127
 
     assert proc.stdout is not None
-    for line in proc.stdout:
-        log.write(line)
+    # Same decoding as text mode (UTF-8 with replacement, universal newlines),
+    # but done per chunk instead of per line.
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True
+    )
+    while True:
+        # read1() returns whatever is available, so interactive prompts
+        # without a trailing newline (e.g. chartread) are shown immediately.
+        chunk = proc.stdout.read1(_RUN_CMD_CHUNK_SIZE)
+        if not chunk:
+            break
+        text = decoder.decode(chunk)
+        if text:
+            log.write(text)
+    text = decoder.decode(b"", final=True)
+    if text:
+        log.write(text)
 
     proc.wait()
     return int(proc.returncode)
 
 
-def _split_cfg_args(cfg_value: str) -> list[str]:
+_SHELL_QUOTE_CHARS = frozenset("'\"\\")  # Characters that need shlex to split correctly
+_SHELL_WS_RE = re.compile(r"[ \t\r\n]+")  # shlex's whitespace set
+
+
+@functools.lru_cache(maxsize=64)
+def _split_cfg_args(cfg_value: str) -> tuple[str, ...]:
     """Split a shell-like argument string from the setup file.
 
     The Bash version stores command argument groups as strings like "-v -d2 -G".
     We parse them using shlex so quoting (if present) is preserved.
+
+    Results are cached per string (setup values rarely change during a run), so
+    a tuple is returned; use list(...) when the arguments need to be extended.
     """
 
     s = (cfg_value or "").strip()
     if not s:
-        return []
-    return shlex.split(s)
+        return ()
+    if _SHELL_QUOTE_CHARS.isdisjoint(s):
+        # Without quotes or escapes shlex splits on whitespace only
+        return tuple(t for t in _SHELL_WS_RE.split(s) if t)
+    import shlex  # Deferred: only needed once commands are being built
+    return tuple(shlex.split(s))
+
+
+_COMMON_ARGS_KEYS = (
+    "COMMON_ARGUMENTS_TARGEN",
+    "COMMON_ARGUMENTS_PRINTTARG",
+    "COMMON_ARGUMENTS_CHARTREAD",
+    "COMMON_ARGUMENTS_COLPROF",
+)
 
 
-def pick_file_gui(title: str, filetypes: list[tuple[str, str]], initialdir: Optional[Path] = None) -> Optional[str]:
+def build_common_args(cfg: dict[str, str]) -> dict[str, tuple[str, ...]]:
+    """Split the COMMON_ARGUMENTS_* setup values once, keyed by setup key."""
+
+    return {key: _split_cfg_args(cfg.get(key, "")) for key in _COMMON_ARGS_KEYS}
+
+
+def _common_args(state: AppState, cfg: dict[str, str], key: str) -> tuple[str, ...]:
+    # Precomputed by main_menu; split on demand when called outside of it
+    args = state.common_args.get(key)
+    return args if args is not None else _split_cfg_args(cfg.get(key, ""))
+
+
+# tkinter modules, imported on the first file dialog (loading Tcl/Tk is slow)
+_tk_mod = None
+_tk_filedialog_mod = None
+_TK_ROOT = None  # Hidden Tk root shared by all file dialogs
+
+
+def pick_file_gui(
+    title: str,
+    filetypes: list[tuple[str, str]],
+    initialdir: Optional[Path] = None,
+    before_show: Optional[Callable[[], None]] = None,
+) -> Optional[str]:
     """GUI file picker using tkinter. Returns path or None if cancelled.
 
     tkinter is a required dependency for this port (no console fallback).
+    before_show, if given, is called once Tk is ready but before its window is
+    raised (used to finish capturing the terminal window on Linux).
     """
 
-    try:
-        import tkinter as tk
-        from tkinter import filedialog
-    except Exception as e:
-        raise RuntimeError(
-            "tkinter is required for file selection dialogs but is not available in this Python installation."
-        ) from e
-
-    root = tk.Tk()
-    root.geometry("1x1+0+0")  # Place off-screen to avoid visible window
+    global _tk_mod, _tk_filedialog_mod
+    if _tk_mod is None:
+        try:
+            import tkinter
+            from tkinter import filedialog as tk_filedialog
+        except Exception as e:
+            raise RuntimeError(
+                "tkinter is required for file selection dialogs but is not available in this Python installation."
+            ) from e
+        _tk_mod, _tk_filedialog_mod = tkinter, tk_filedialog
+    tk, filedialog = _tk_mod, _tk_filedialog_mod
+
+    # Reuse one hidden root across dialogs; creating a Tk() starts a new Tcl
+    # interpreter each time, which is noticeably slow.
+    global _TK_ROOT
+    if _TK_ROOT is not None:
+        try:
+            _TK_ROOT.winfo_exists()
+        except tk.TclError:
+            _TK_ROOT = None  # Root was destroyed behind our back; make a new one
+    if _TK_ROOT is None:
+        _TK_ROOT = tk.Tk()
+        _TK_ROOT.geometry("1x1+0+0")  # Place off-screen to avoid visible window
+        _TK_ROOT.withdraw()
+    root = _TK_ROOT
+    if before_show is not None:
+        before_show()
+    root.deiconify()
 
     try:
         # Try to place dialog on top and ensure focus
@@ -329,9 +623,7 @@ def pick_file_gui(title: str, filetypes: list[tuple[str, str]], initialdir: Opti
 
     root.lift()  # Bring to front
     root.focus_force()  # Force focus
-
-    import time
-    time.sleep(0.1)  # Short delay to ensure focus takes effect
+    root.update_idletasks()  # Let pending window changes take effect before the dialog opens
 
     kwargs: dict[str, object] = {
         "title": title,
@@ -341,29 +633,61 @@ def pick_file_gui(title: str, filetypes: list[tuple[str, str]], initialdir: Opti
     if initialdir is not None:
         kwargs["initialdir"] = str(initialdir)
 
-    path = filedialog.askopenfilename(**kwargs)
     try:
-        root.destroy()
-    except Exception:
-        pass
+        path = filedialog.askopenfilename(**kwargs)
+    finally:
+        try:
+            root.withdraw()  # Hide again instead of destroying, for the next dialog
+        except Exception:
+            pass
 
     return path or None
 
 
-def _collect_matching_tifs(source_folder: Path, name: str) -> list[Path]:
+def _collect_matching_tifs(
+    source_folder: Path, name: str, also_find: Optional[dict[str, bool]] = None
+) -> list[Path]:
     """Return matching .tif files for a base name.
 
     Mirrors Bash behavior:
     - single-page: <name>.tif
     - multi-page:  <name>_01.tif, <name>_02.tif, ... (pattern _??.tif)
+
+    If also_find is given, its keys are other file names to look for in the
+    same pass; each value is set to True when that file exists.
     """
 
-    single = source_folder / f"{name}.tif"
-    if single.is_file():
-        return [single]
+    # One directory pass instead of a stat plus a glob; names are compared with
+    # normcase like glob does (case-insensitive on Windows).
+    single_name = os.path.normcase(f"{name}.tif")
+    prefix = os.path.normcase(f"{name}_")
+    multi_len = len(prefix) + len("??.tif")
+    extra = {os.path.normcase(n): n for n in also_find} if also_find else {}
+    single: Optional[str] = None
+    pages: list[str] = []
+    try:
+        with os.scandir(source_folder) as it:
+            for entry in it:
+                entry_name = os.path.normcase(entry.name)
+                if entry_name in extra:
+                    if entry.is_file():
+                        also_find[extra[entry_name]] = True
+                elif entry_name == single_name:
+                    if entry.is_file():
+                        single = entry.name
+                elif (
+                    len(entry_name) == multi_len
+                    and entry_name.startswith(prefix)
+                    and entry_name.endswith(".tif")
+                    and entry.is_file()
+                ):
+                    pages.append(entry.name)
+    except OSError:
+        return []
 
-    files = sorted(source_folder.glob(f"{name}_??.tif"))
-    return [p for p in files if p.is_file()]
+    if single is not None:
+        return [source_folder / single]
+    return [source_folder / n for n in sorted(pages)]
 
 
 def _copy_or_overwrite_submenu(
@@ -391,9 +715,9 @@ def _copy_or_overwrite_submenu(
         log.writeln("3: Abort operation")
         log.writeln("")
 
-        print("Enter your choice [1-3]: ", end='', flush=True)
+        log.prompt("Enter your choice [1-3]: ")
         copy_choice = getch()
-        print(copy_choice, flush=True)
+        print(copy_choice)
         log.writeln("")
 
         if copy_choice == "1":
@@ -423,6 +747,7 @@ def _copy_or_overwrite_submenu(
             except OSError:
                 log.writeln(f"❌ Failed to change directory to '{state.profile_folder}'")
                 return False
+            state.profile_folder_resolved = os.getcwd()
             return True
 
         if copy_choice == "3":
@@ -432,6 +757,128 @@ def _copy_or_overwrite_submenu(
         log.writeln("Invalid selection. Please choose 1 or 2.")
 
 
+_LINUX_WM_TOOLS: Optional[dict[str, Optional[str]]] = None  # Filled on first use
+
+
+def _linux_wm_tools() -> dict[str, Optional[str]]:
+    """Return cached PATH lookups for the Linux window focus helpers."""
+
+    global _LINUX_WM_TOOLS
+    if _LINUX_WM_TOOLS is None:
+        names = ["xdotool", "xprop", "wmctrl"]
+        _LINUX_WM_TOOLS = dict(zip(names, _which_all(names)))
+    return _LINUX_WM_TOOLS
+
+
+_FOCUS_TERMINAL_APPLESCRIPT = [
+    'tell application "Terminal" to activate',
+    'tell application "System Events" to set frontmost of process "Terminal" to true',
+]
+_focus_scpt_path: Optional[str] = None  # Compiled AppleScript ("" if compiling failed)
+_x_display = None  # python-xlib Display, opened on first focus return
+
+
+def _compiled_focus_script() -> Optional[str]:
+    """Compile the macOS focus AppleScript once, so later runs skip parsing."""
+
+    global _focus_scpt_path
+    if _focus_scpt_path is None:
+        import tempfile
+        target = Path(tempfile.gettempdir()) / "Argyll_Printer_Profiler_focus_terminal.scpt"
+        args = ["osacompile", "-o", str(target)]
+        for line in _FOCUS_TERMINAL_APPLESCRIPT:
+            args += ["-e", line]
+        try:
+            result = subprocess.run(args, capture_output=True, check=False)
+            _focus_scpt_path = str(target) if result.returncode == 0 else ""
+        except OSError:
+            _focus_scpt_path = ""
+    return _focus_scpt_path or None
+
+
+def _activate_x_window(win_id: str) -> bool:
+    """Activate an X11 window in-process via python-xlib, if it is installed.
+
+    Sends the same _NET_ACTIVE_WINDOW request as `xdotool windowactivate`.
+    Returns False when python-xlib is missing or the request fails.
+    """
+
+    global _x_display
+    try:
+        from Xlib import X, display, protocol
+    except ImportError:
+        return False
+    try:
+        if _x_display is None:
+            _x_display = display.Display()
+        window = _x_display.create_resource_object("window", int(win_id, 0))
+        event = protocol.event.ClientMessage(
+            window=window,
+            client_type=_x_display.intern_atom("_NET_ACTIVE_WINDOW"),
+            data=(32, [2, X.CurrentTime, 0, 0, 0]),  # 2 = request from a pager/tool
+        )
+        _x_display.screen().root.send_event(
+            event, event_mask=X.SubstructureRedirectMask | X.SubstructureNotifyMask
+        )
+        _x_display.flush()
+    except Exception:
+        _x_display = None
+        return False
+    return True
+
+
+def _focus_terminal(PLATFORM: str, term_win_id: Optional[str]) -> None:
+    """Bring focus back to the terminal window after a file dialog."""
+
+    if PLATFORM == "macos":
+        # Use osascript to activate Terminal and set frontmost (pre-compiled when possible)
+        scpt = _compiled_focus_script()
+        if scpt:
+            subprocess.run(["osascript", scpt], check=False)
+        else:
+            args = ["osascript"]
+            for line in _FOCUS_TERMINAL_APPLESCRIPT:
+                args += ["-e", line]
+            subprocess.run(args, check=False)
+    elif PLATFORM == "windows":
+        # Use Windows API to set console window as foreground
+        import ctypes
+        ctypes.windll.user32.SetForegroundWindow(ctypes.windll.kernel32.GetConsoleWindow())
+    elif PLATFORM == "linux":
+        # Activate the captured window in-process if possible, else via xdotool or wmctrl
+        if term_win_id and not _activate_x_window(term_win_id):
+            wm_tools = _linux_wm_tools()
+            if wm_tools["xdotool"]:
+                subprocess.run(["xdotool", "windowactivate", term_win_id], check=False)
+            elif wm_tools["wmctrl"]:
+                subprocess.run(["wmctrl", "-ia", term_win_id], check=False)
+
+
+def resolve_profile_path(state: AppState, path_str: str) -> Optional[str]:
+    """Return the resolved path of an ICC profile file, or None if it is not a file.
+
+    Results are cached on state until main_menu or a setup edit clears them.
+    """
+
+    try:
+        return state.resolved_icc_paths[path_str]
+    except KeyError:
+        pass
+    # Plain string ops: only the resolved string is ever used
+    p = os.path.expanduser(path_str)
+    resolved = os.path.realpath(p) if os.path.isfile(p) else None
+    state.resolved_icc_paths[path_str] = resolved
+    return resolved
+
+
+def resolve_cfg_folders(state: AppState, cfg: dict[str, str]) -> tuple[Path, Path]:
+    """Resolve the created-profiles and pre-made-targets folders and store them on state."""
+
+    state.created_profiles_dir = state.script_dir / cfg.get("CREATED_PROFILES_FOLDER", "Created_Profiles")
+    state.pre_made_targets_dir = state.script_dir / cfg.get("PRE_MADE_TARGETS_FOLDER", "Pre-made_Targets")
+    return state.created_profiles_dir, state.pre_made_targets_dir
+
+
 def select_file(state: AppState, cfg: dict[str, str], log: TeeLogger) -> bool:
     """Unified file selection function driven by state.action.
 
@@ -456,13 +903,13 @@ def select_file(state: AppState, cfg: dict[str, str], log: TeeLogger) -> bool:
         allowed_suffixes = {".icc", ".icm"}
         invalid_suffix_message = "❌ Selected file is not a .icc or .icm file."
     elif state.action == "3":
-        initialdir = state.script_dir / cfg.get("PRE_MADE_TARGETS_FOLDER", "Pre-made_Targets")
+        initialdir = state.pre_made_targets_dir or resolve_cfg_folders(state, cfg)[1]
         title = state.dialog_title
         filetypes = [("Target Information 2 data", "*.ti2"), ("All files", "*")]
         allowed_suffixes = {".ti2"}
         invalid_suffix_message = "❌ Selected file is not a .ti2 file."
     elif state.action in {"2", "4", "5"}:
-        initialdir = state.script_dir / cfg.get("CREATED_PROFILES_FOLDER", "Created_Profiles")
+        initialdir = state.created_profiles_dir or resolve_cfg_folders(state, cfg)[0]
         title = state.dialog_title
         filetypes = [("Target Information 3 data", "*.ti3"), ("All files", "*")]
         allowed_suffixes = {".ti3"}
@@ -471,51 +918,58 @@ def select_file(state: AppState, cfg: dict[str, str], log: TeeLogger) -> bool:
         log.writeln(f"❌ Unsupported action for file selection: {state.action}")
         return False
 
-    # Capture the ID of the currently active window (terminal) for later focus return on Linux
+    # Capture the ID of the currently active window (terminal) for later focus return on Linux.
+    # The query is started here and collected once Tk is initialised (but before
+    # its window is shown), so it overlaps with the slow Tk startup.
     term_win_id = None
+    win_id_proc: Optional[subprocess.Popen[str]] = None
+    wm_tools = _linux_wm_tools() if state.PLATFORM == "linux" else {}
     if state.PLATFORM == "linux":
+        win_id_cmd: Optional[list[str]] = None
         # Try xdotool first for getting active window
-        if shutil.which("xdotool"):
-            try:
-                result = subprocess.run(["xdotool", "getactivewindow"], capture_output=True, text=True, timeout=2)
-                if result.returncode == 0:
-                    term_win_id = result.stdout.strip()
-            except subprocess.TimeoutExpired:
-                pass
+        if wm_tools["xdotool"]:
+            win_id_cmd = ["xdotool", "getactivewindow"]
         # Fallback to xprop if xdotool not available
-        elif shutil.which("xprop"):
+        elif wm_tools["xprop"]:
+            win_id_cmd = ["xprop", "-root", "_NET_ACTIVE_WINDOW"]
+        if win_id_cmd:
             try:
-                result = subprocess.run(["xprop", "-root", "_NET_ACTIVE_WINDOW"], capture_output=True, text=True, timeout=2)
-                if result.returncode == 0:
-                    term_win_id = result.stdout.split()[-1].strip()
-            except subprocess.TimeoutExpired:
+                win_id_proc = subprocess.Popen(
+                    win_id_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+                )
+            except OSError:
                 pass
 
+    def _collect_term_win_id() -> None:
+        nonlocal term_win_id, win_id_proc
+        if win_id_proc is None:
+            return
+        proc, win_id_proc = win_id_proc, None
+        try:
+            out, _ = proc.communicate(timeout=2)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            return
+        # xdotool prints the bare ID, xprop prints "... # 0x<id>"
+        if proc.returncode == 0 and out.split():
+            term_win_id = out.split()[-1].strip()
+
     try:
         selected = pick_file_gui(
             title=title,
             filetypes=filetypes,
             initialdir=initialdir,
+            before_show=_collect_term_win_id,
         )
     except RuntimeError as e:
         log.writeln(f"❌ {e}")
         return False
+    finally:
+        _collect_term_win_id()  # No-op if already collected by the dialog
 
     # Bring focus back to terminal after dialog closes (for cancel/exit and successful selection)
-    if state.PLATFORM == "macos":
-        # Use osascript to activate Terminal and set frontmost
-        subprocess.run(["osascript", "-e", 'tell application "Terminal" to activate', "-e", 'tell application "System Events" to set frontmost of process "Terminal" to true'], check=False)
-    elif state.PLATFORM == "windows":
-        # Use Windows API to set console window as foreground
-        import ctypes
-        ctypes.windll.user32.SetForegroundWindow(ctypes.windll.kernel32.GetConsoleWindow())
-    elif state.PLATFORM == "linux":
-        # Use xdotool or wmctrl to activate the captured window
-        if term_win_id:
-            if shutil.which("xdotool"):
-                subprocess.run(["xdotool", "windowactivate", term_win_id], check=False)
-            elif shutil.which("wmctrl"):
-                subprocess.run(["wmctrl", "-ia", term_win_id], check=False)
+    _focus_terminal(state.PLATFORM, term_win_id)
 
     if not selected:
         log.writeln("Selection cancelled.")
@@ -543,23 +997,27 @@ def select_file(state: AppState, cfg: dict[str, str], log: TeeLogger) -> bool:
 
     source_folder_path = Path(state.source_folder)
 
+    # Actions 2/3 scan the folder for TIFF targets anyway, so the .ti2 check for
+    # action 2 rides along on that directory pass.
+    if state.action in {"2", "3"}:
+        ti2_name = f"{state.name}.ti2"
+        present = {ti2_name: False}
+        tif_files = _collect_matching_tifs(source_folder_path, state.name, present)
+
     # select_ti3_file: require matching .ti2
     if state.action == "2":
-        ti2_path = source_folder_path / f"{state.name}.ti2"
-        if not ti2_path.is_file():
+        if not present[ti2_name]:
             log.writeln(f"❌ Matching .ti2 file not found for '{state.name}'.")
             return False
 
     # select_ti3_file_only (action 5): require matching .icc
     if state.action == "5":
-        icc_path = source_folder_path / f"{state.name}.icc"
-        if not icc_path.is_file():
+        if not os.path.isfile(os.path.join(state.source_folder, f"{state.name}.icc")):
             log.writeln(f"❌ Matching .icc file not found for '{state.name}'.")
             return False
 
     # select_ti2_file and select_ti3_file: require matching TIFF targets
     if state.action in {"2", "3"}:
-        tif_files = _collect_matching_tifs(source_folder_path, state.name)
         if not tif_files:
             log.writeln(f"❌ No matching .tif target images found for '{state.name}'.")
             return False
@@ -580,6 +1038,7 @@ def select_file(state: AppState, cfg: dict[str, str], log: TeeLogger) -> bool:
         except OSError:
             log.writeln(f"❌ Failed to change directory to '{state.profile_folder}'")
             return False
+        state.profile_folder_resolved = os.getcwd()
 
     # Submenu timing differences:
     # - select_ti2_file: always show submenu
@@ -618,42 +1077,69 @@ def select_file(state: AppState, cfg: dict[str, str], log: TeeLogger) -> bool:
 # ------------------- Ported function stubs (to be filled) -------------------
 
 
+# Allowed characters for profile/file names entered by the user. Validation
+# deletes every allowed character; a valid name leaves nothing behind.
+_VALID_FNAME_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._()-")
+_VALID_FNAME_DEL_TABLE = str.maketrans("", "", "".join(sorted(_VALID_FNAME_CHARS)))
+
+
+def _is_valid_filename(name: str) -> bool:
+    """Return True if name is non-empty and only uses allowed filename characters."""
+
+    return bool(name) and not name.translate(_VALID_FNAME_DEL_TABLE)
+
+
+# Input validators used on every prompt iteration
+_ARG_RE = re.compile(r"[A-Za-z0-9._()/\-\s]+")  # custom targen/printtarg arguments
+_MENU19_RE = re.compile(r"[1-9]")  # single-key menu choice
+_TIF_SUFFIX_RE = re.compile(r"_[0-9]{2}$")  # page suffix of multi-page chart TIFFs
+_NUM_RE = re.compile(r"\A[0-9]+(?:\.[0-9]+)?\Z")  # non-negative decimal setup value
+_ARGYLL_VER_RE = re.compile(r"Version ([0-9.]+)")  # version in the first line of dispcal's usage text
+
+
 def print_profile_name_menu(log: TeeLogger, cfg: dict[str, str], last_line: str, current_name: str | None = None, show_example: bool = True, current_display: str | None = None) -> None:
     example = cfg.get("EXAMPLE_FILE_NAMING", "")
-    log.writeln("")
-    log.writeln("")
-    log.writeln("")
-    log.writeln("─────────────────────────────────────────────────────────────────────")
-    log.writeln("Specify Profile Description / File Name")
-    log.writeln("─────────────────────────────────────────────────────────────────────")
-    log.writeln("")
-    log.writeln("The following is highly recommended to include:")
-    log.writeln("  - Printer ID")
-    log.writeln("  - Paper ID")
-    log.writeln("  - Color Space")
-    log.writeln("  - Target used for profile")
-    log.writeln("  - Instrument/calibration type used")
-    log.writeln("  - Date created")
-    log.writeln("")
+    # Build the whole menu first and emit it with a single write
+    parts = [
+        "",
+        "",
+        "",
+        "─────────────────────────────────────────────────────────────────────",
+        "Specify Profile Description / File Name",
+        "─────────────────────────────────────────────────────────────────────",
+        "",
+        "The following is highly recommended to include:",
+        "  - Printer ID",
+        "  - Paper ID",
+        "  - Color Space",
+        "  - Target used for profile",
+        "  - Instrument/calibration type used",
+        "  - Date created",
+        "",
+    ]
     if show_example:
-        log.writeln("Example file naming convention (select and copy):")
+        parts.append("Example file naming convention (select and copy):")
         if example:
-            log.writeln(f"{example}")
-        log.writeln("")
-        log.writeln("For simplicity, profile description and filename are made identical.")
-        log.writeln("The profile description is what you will see in Photoshop and ColorSync Utility.")
-        log.writeln("")
-        log.writeln("Enter a desired filename for this profile.")
-        log.writeln("If your filename is foobar, your profile will be named foobar.icc.")
-        log.writeln("")
+            parts.append(f"{example}")
+        parts += [
+            "",
+            "For simplicity, profile description and filename are made identical.",
+            "The profile description is what you will see in Photoshop and ColorSync Utility.",
+            "",
+            "Enter a desired filename for this profile.",
+            "If your filename is foobar, your profile will be named foobar.icc.",
+            "",
+        ]
     if not current_display and current_name:
         current_display = f"Current name: {current_name}"
     if current_display:
-        log.writeln(current_display)
-        log.writeln("")
-    log.writeln("Valid values: Letters A–Z a–z, digits 0–9, dash -, underscore _, parentheses ( ), dot .")
-    log.writeln(last_line)
-    log.writeln("")
+        parts += [current_display, ""]
+    parts += [
+        "Valid values: Letters A–Z a–z, digits 0–9, dash -, underscore _, parentheses ( ), dot .",
+        last_line,
+        "",
+    ]
+    log.write("\n".join(parts) + "\n")
 
 
 def prepare_profile_folder(state: AppState, cfg: dict[str, str], log: TeeLogger) -> bool:
@@ -667,7 +1153,7 @@ def prepare_profile_folder(state: AppState, cfg: dict[str, str], log: TeeLogger)
         log.writeln("❌ action variable not set")
         return False
 
-    created_profiles_folder = cfg.get("CREATED_PROFILES_FOLDER", "Created_Profiles")
+    created_profiles_dir = state.created_profiles_dir or resolve_cfg_folders(state, cfg)[0]
 
     # Default fallback
     state.new_name = state.name
@@ -696,7 +1182,7 @@ def prepare_profile_folder(state: AppState, cfg: dict[str, str], log: TeeLogger)
                     log.writeln("⏎ Input cancelled. Returning to previous menu...")
                     return False
 
-            if not re.fullmatch(r"[A-Za-z0-9._()\-]+", name):
+            if not _is_valid_filename(name):
                 log.writeln("❌ Invalid file name characters. Please try again.")
                 continue
 
@@ -704,7 +1190,7 @@ def prepare_profile_folder(state: AppState, cfg: dict[str, str], log: TeeLogger)
             break
 
     while True:
-        profile_folder = state.script_dir / created_profiles_folder / state.new_name
+        profile_folder = created_profiles_dir / state.new_name
 
         if profile_folder.is_dir():
             log.writeln("")
@@ -712,8 +1198,9 @@ def prepare_profile_folder(state: AppState, cfg: dict[str, str], log: TeeLogger)
             log.writeln("")
             log.writeln("Contents:")
             try:
-                for p in sorted(profile_folder.iterdir()):
-                    log.writeln(f"  {p.name}")
+                with os.scandir(profile_folder) as it:
+                    for entry_name in sorted(e.name for e in it):
+                        log.writeln(f"  {entry_name}")
             except OSError:
                 log.writeln("  (Unable to list contents of '{str(profile_folder)}')")
             log.writeln("")
@@ -723,20 +1210,28 @@ def prepare_profile_folder(state: AppState, cfg: dict[str, str], log: TeeLogger)
             log.writeln("  3) Cancel operation")
             log.writeln("")
             while True:
-                print("Enter choice [1-3]: ", end='', flush=True)
+                log.prompt("Enter choice [1-3]: ")
                 choice = getch()
-                print(choice, flush=True)
+                print(choice)
                 log.writeln("")
                 if choice == "1":
                     log.writeln("")
                     log.writeln(f"Using existing folder: '{str(profile_folder)}'")
-                    # Delete existing contents to avoid leftover files from previous runs
-                    for item in profile_folder.iterdir():
+                    # Delete existing contents to avoid leftover files from previous runs.
+                    # Rescan here: the folder may have changed while waiting for the choice,
+                    # and scandir entries carry cached type info (no extra stat() per item)
+                    try:
+                        with os.scandir(profile_folder) as it:
+                            entries = list(it)
+                    except OSError as e:
+                        entries = []
+                        log.writeln(f"⚠️ Warning: Failed to list '{str(profile_folder)}': {e}")
+                    for item in entries:
                         try:
-                            if item.is_file() or item.is_symlink():
-                                item.unlink()
-                            elif item.is_dir():
-                                shutil.rmtree(item)
+                            if item.is_file(follow_symlinks=False) or item.is_symlink():
+                                os.unlink(item.path)
+                            elif item.is_dir(follow_symlinks=False):
+                                shutil.rmtree(item.path)
                         except OSError as e:
                             log.writeln(f"⚠️ Warning: Failed to delete {item.name}: {e}")
                     break
@@ -754,13 +1249,13 @@ def prepare_profile_folder(state: AppState, cfg: dict[str, str], log: TeeLogger)
                             log.writeln("⏎ Input cancelled. Returning to previous menu...")
                             return False
 
-                        if not re.fullmatch(r"[A-Za-z0-9._()\-]+", name):
+                        if not _is_valid_filename(name):
                             log.writeln("❌ Invalid file name characters. Please try again.")
                             continue
 
                         state.new_name = name
                         break
-                    profile_folder = state.script_dir / created_profiles_folder / state.new_name
+                    profile_folder = created_profiles_dir / state.new_name
                     break
                 if choice == "3":
                     log.writeln("")
@@ -787,10 +1282,99 @@ def prepare_profile_folder(state: AppState, cfg: dict[str, str], log: TeeLogger)
         return False
 
     state.profile_folder = str(profile_folder)
+    state.profile_folder_resolved = os.getcwd()
     state.desc = state.new_name
     return True
 
 
+_FICLONE = 0x40049409  # Linux ioctl (linux/fs.h): share extents with another file (reflink)
+
+
+def _kernel_copy(src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copy size bytes between open files without going through user space (Linux).
+
+    Tries a reflink clone first (O(1) on Btrfs/XFS), then os.copy_file_range, then
+    os.sendfile (e.g. on EXDEV/ENOTSUP). Returns False if none is supported so the
+    caller can fall back.
+    """
+
+    try:
+        import fcntl
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        return True
+    except (ImportError, OSError):
+        pass
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            remaining = size
+            while remaining > 0:
+                copied = os.copy_file_range(src_fd, dst_fd, remaining)
+                if copied == 0:
+                    break  # Early EOF, or a filesystem that copies nothing (procfs, some FUSE/network mounts)
+                remaining -= copied
+            if remaining == 0:
+                return True
+        except OSError:
+            pass
+
+    if not hasattr(os, "sendfile"):
+        return False
+    try:
+        # Start over in case copy_file_range got part of the way
+        os.ftruncate(dst_fd, 0)
+        os.lseek(dst_fd, 0, os.SEEK_SET)
+        offset = 0
+        while offset < size:
+            sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    except OSError:
+        return False
+    # A short copy lets _fast_copy fall back to shutil.copyfile
+    return offset == size
+
+
+def _fast_copy(src: str | Path, dst: str | Path, copy_stat: bool = True) -> None:
+    """Copy file contents and metadata from src to dst (like shutil.copy2).
+
+    With copy_stat=False only the contents are copied (like shutil.copyfile).
+
+    Uses a kernel-side copy on Linux, otherwise shutil.copyfile (which already uses
+    the platform fast path where one exists).
+    """
+
+    copied = False
+    if sys.platform.startswith("linux"):
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            copied = _kernel_copy(fsrc.fileno(), fdst.fileno(), os.fstat(fsrc.fileno()).st_size)
+    if not copied:
+        shutil.copyfile(src, dst)
+    if copy_stat:
+        shutil.copystat(src, dst)
+
+
+def _batch_copy(pairs: list[tuple[str, str, bool]]) -> list[Optional[OSError]]:
+    """Copy all (src, dst, copy_stat) entries in one batch; returns the error (or None) per entry, in order.
+
+    The copies are submitted together and run concurrently, so their I/O overlaps
+    instead of being issued one blocking copy at a time.
+    """
+
+    def _copy_one(pair: tuple[str, str, bool]) -> Optional[OSError]:
+        try:
+            _fast_copy(*pair)
+        except OSError as e:
+            return e
+        return None
+
+    if len(pairs) <= 1:
+        return [_copy_one(pair) for pair in pairs]
+    with ThreadPoolExecutor(max_workers=min(4, len(pairs))) as ex:
+        return list(ex.map(_copy_one, pairs))
+
+
 def copy_files_ti1_ti2_ti3_tif(state: AppState, cfg: dict[str, str], log: TeeLogger) -> bool:
     """Copy relevant .ti1/.ti2/.ti3/.tif files into working folder."""
 
@@ -798,70 +1382,79 @@ def copy_files_ti1_ti2_ti3_tif(state: AppState, cfg: dict[str, str], log: TeeLog
     if not state.source_folder or not state.profile_folder:
         return False
 
-    source = Path(state.source_folder)
-    dest = Path(state.profile_folder)
+    # Plain strings throughout; paths are only joined for the copy itself
+    source = state.source_folder
+    dest = state.profile_folder
+    n = state.name
 
-    def _copy_if_exists(path: Path, required: bool, missing_message: str) -> bool:
-        if not state.name or not path.is_file():
+    # All presence checks run first; the collected copies are then done in one batch.
+    # Each pending copy carries the message to show if it fails.
+    pending: list[tuple[str, str, bool, str]] = []
+
+    # One directory listing of the source instead of a stat per candidate file
+    try:
+        with os.scandir(source) as it:
+            src_entries = {e.name: e for e in it}
+    except OSError:
+        src_entries = {}
+
+    def _maybe_copy(name: str, required: bool, missing_message: str) -> bool:
+        entry = src_entries.get(name)
+        if not n or entry is None or not entry.is_file():
             if required:
                 log.writeln(missing_message)
                 return False
             if missing_message:
                 log.writeln(missing_message)
             return True
-        if path.parent == dest:
+        if os.path.normpath(source) == os.path.normpath(dest):
             return True
-        try:
-            shutil.copy2(path, dest / path.name)
-        except OSError:
-            log.writeln(f"❌ Failed to copy {path.name} to directory '{str(dest)}'")
-            log.writeln("Profile folder is left as is:")
-            log.writeln(f"'{str(dest)}'")
-            return False
+        pending.append((entry.path, os.path.join(dest, name), True, f"❌ Failed to copy {name} to directory '{dest}'"))
         return True
 
     # .ti1 is optional
-    if not _copy_if_exists(
-        source / f"{state.name}.ti1",
+    if not _maybe_copy(
+        f"{n}.ti1",
         required=False,
-        missing_message=f"⚠️ .ti1 file not found for '{state.name}'. Ignoring.",
+        missing_message=f"⚠️ .ti1 file not found for '{n}'. Ignoring.",
     ):
         return False
 
     # .ti2 required unless action 4
-    if state.action == "4":
-        if not _copy_if_exists(
-            source / f"{state.name}.ti2",
-            required=False,
-            missing_message=f"⚠️ .ti2 file not found for '{state.name}'. Ignoring.",
-        ):
-            return False
-    else:
-        if not _copy_if_exists(
-            source / f"{state.name}.ti2",
-            required=True,
-            missing_message=f"❌ .ti2 file not found for '{state.name}'.",
-        ):
-            return False
+    ti2_required = state.action != "4"
+    if not _maybe_copy(
+        f"{n}.ti2",
+        required=ti2_required,
+        missing_message=(
+            f"❌ .ti2 file not found for '{n}'." if ti2_required else f"⚠️ .ti2 file not found for '{n}'. Ignoring."
+        ),
+    ):
+        return False
 
     # .ti3 required for action 2 or 4
     if state.action in {"2", "4"}:
-        if not _copy_if_exists(
-            source / f"{state.name}.ti3",
+        if not _maybe_copy(
+            f"{n}.ti3",
             required=True,
-            missing_message=f"❌ .ti3 file not found for '{state.name}'.",
+            missing_message=f"❌ .ti3 file not found for '{n}'.",
         ):
             return False
 
+    # TIFFs are only printed from, so their contents are enough; the .ti* files above
+    # keep their timestamps and mode (like shutil.copy2), since mtimes are compared later.
+    dest_norm = os.path.normpath(dest)
     for f in state.tif_files:
-        if f.parent == dest:
+        src_path = str(f)
+        if os.path.dirname(src_path) == dest_norm:
             continue
-        try:
-            shutil.copy2(f, dest / f.name)
-        except OSError:
-            log.writeln(f"❌ Failed to copy {f.name} to '{str(dest)}'")
+        pending.append((src_path, os.path.join(dest, f.name), False, f"❌ Failed to copy {f.name} to '{dest}'"))
+
+    errors = _batch_copy([(src, dst, copy_stat) for src, dst, copy_stat, _msg in pending])
+    for (_src, _dst, _copy_stat, error_msg), error in zip(pending, errors):
+        if error is not None:
+            log.writeln(error_msg)
             log.writeln("Profile folder is left as is:")
-            log.writeln(f"'{str(dest)}'")
+            log.writeln(f"'{dest}'")
             return False
 
     return True
@@ -875,11 +1468,13 @@ def rename_files_ti1_ti2_ti3_tif(state: AppState, cfg: dict[str, str], log: TeeL
         return False
 
     profile_folder = Path(state.profile_folder)
-    if Path.cwd().resolve() != profile_folder.resolve():
+    # The cached resolved folder matches os.getcwd() on the usual path; only resolve on mismatch
+    if os.getcwd() != state.profile_folder_resolved and Path.cwd().resolve() != profile_folder.resolve():
         log.writeln(f"⚠️ Not in profile folder. Current: {Path.cwd()}")
         log.writeln(f"🔄 Attempting to change to profile folder: '{str(profile_folder)}'")
         try:
             os.chdir(profile_folder)
+            state.profile_folder_resolved = os.getcwd()
             log.writeln("✅ Successfully changed to profile folder")
         except OSError:
             log.writeln("❌ Failed to change to profile folder.")
@@ -889,65 +1484,67 @@ def rename_files_ti1_ti2_ti3_tif(state: AppState, cfg: dict[str, str], log: TeeL
 
     log.writeln("Renaming files to match new profile name…")
 
-    def _rename_if_exists(old: Path, new: Path, error_msg: str) -> bool:
-        if not old.is_file():
-            return True
+    pf = str(profile_folder)
+    n, nn = state.name, state.new_name
+
+    # Rename relative to one open handle on the profile folder where supported, so the
+    # folder path is looked up once instead of for every file.
+    pfd: Optional[int] = None
+    if hasattr(os, "O_DIRECTORY") and os.rename in os.supports_dir_fd:
         try:
-            old.rename(new)
+            pfd = os.open(pf, os.O_RDONLY | os.O_DIRECTORY)
         except OSError:
-            log.writeln(error_msg)
-            log.writeln("Existing files are left in profile folder:")
-            log.writeln(f"'{str(profile_folder)}'")
+            pfd = None
+
+    def _rename(old_name: str, new_name: str) -> bool:
+        # rename() itself reports a missing source, so no existence check is needed first.
+        # Returns False if old_name does not exist; other errors are raised.
+        try:
+            if pfd is None:
+                os.rename(os.path.join(pf, old_name), os.path.join(pf, new_name))
+            else:
+                os.rename(old_name, new_name, src_dir_fd=pfd, dst_dir_fd=pfd)
+        except FileNotFoundError:
             return False
         return True
 
-    if not _rename_if_exists(
-        profile_folder / f"{state.name}.ti1",
-        profile_folder / f"{state.new_name}.ti1",
-        f"❌ Failed to rename {state.name}.ti1 → {state.new_name}.ti1",
-    ):
-        return False
-
-    if not _rename_if_exists(
-        profile_folder / f"{state.name}.ti2",
-        profile_folder / f"{state.new_name}.ti2",
-        f"❌ Failed to rename {state.name}.ti2 → {state.new_name}.ti2",
-    ):
+    def _rename_failed(old_name: str, new_name: str) -> bool:
+        log.writeln(f"❌ Failed to rename {old_name} → {new_name}")
+        log.writeln("Existing files are left in profile folder:")
+        log.writeln(f"'{pf}'")
         return False
 
-    if state.action in {"2", "4"}:
-        if not _rename_if_exists(
-            profile_folder / f"{state.name}.ti3",
-            profile_folder / f"{state.new_name}.ti3",
-            f"❌ Failed to rename {state.name}.ti3 → {state.new_name}.ti3",
-        ):
-            return False
+    try:
+        for ext, applies in (("ti1", True), ("ti2", True), ("ti3", state.action in {"2", "4"})):
+            if not applies:
+                continue
+            try:
+                _rename(f"{n}.{ext}", f"{nn}.{ext}")
+            except OSError:
+                return _rename_failed(f"{n}.{ext}", f"{nn}.{ext}")
 
-    new_tifs: list[Path] = []
-    for f in state.tif_files:
-        ext = f.suffix
-        base = f.stem
-        suffix = ""
-        m = re.search(r"_[0-9]{2}$", base)
-        if m:
-            suffix = m.group(0)
-        new_name = f"{state.new_name}{suffix}{ext}"
-        old_path = profile_folder / f.name
-        new_path = profile_folder / new_name
-        if not old_path.is_file():
-            continue
-        try:
-            old_path.rename(new_path)
-        except OSError:
-            log.writeln(f"❌ Failed to rename {old_path.name} → {new_path.name}")
-            log.writeln("Existing files are left in profile folder:")
-            log.writeln(f"'{str(profile_folder)}'")
-            return False
-        new_tifs.append(new_path)
+        new_tifs: list[Path] = []
+        for f in state.tif_files:
+            ext = f.suffix
+            base = f.stem
+            suffix = ""
+            m = _TIF_SUFFIX_RE.search(base)
+            if m:
+                suffix = m.group(0)
+            new_name = f"{nn}{suffix}{ext}"
+            try:
+                if not _rename(f.name, new_name):
+                    continue
+            except OSError:
+                return _rename_failed(f.name, new_name)
+            new_tifs.append(Path(os.path.join(pf, new_name)))
+    finally:
+        if pfd is not None:
+            os.close(pfd)
 
     state.tif_files = new_tifs
-    state.name = state.new_name
-    state.desc = state.new_name
+    state.name = nn
+    state.desc = nn
     return True
 
 
@@ -963,7 +1560,7 @@ def specify_profile_name(state: AppState, cfg: dict[str, str], log: TeeLogger) -
             log.writeln("⏎ Input cancelled. Returning to previous menu...")
             return False
 
-        if not re.fullmatch(r"[A-Za-z0-9._()\-]+", name):
+        if not _is_valid_filename(name):
             log.writeln("❌ Invalid file name characters. Please try again.")
             continue
 
@@ -981,43 +1578,50 @@ def specify_profile_name(state: AppState, cfg: dict[str, str], log: TeeLogger) -
     return True
 
 
+# Static instrument selection menu
+_INSTRUMENT_MENU_LINES = (
+    "",
+    "",
+    "─────────────────────────────────────────────────────────────────────",
+    "Specify Spectrophotometer Model",
+    "─────────────────────────────────────────────────────────────────────",
+    "",
+    "This affects how the target chart is generated.",
+    "",
+    "1: i1Pro",
+    "2: i1Pro3+",
+    "3: ColorMunki",
+    "4: DTP20",
+    "5: DTP22",
+    "6: DTP41",
+    "7: DTP51",
+    "8: SpectroScan",
+    "9: Abort creating target.",
+    "",
+    "Notes:",
+    "  - A menu of target chart options will be presented next step.",
+    "  - Option '3: ColorMunki' has a separate configurable menu from the rest.",
+    "  - The menu option and command arguments for targen and printtarg may be",
+    "    edited in .ini file.",
+    "",
+    "─────────────────────────────────────────────────────────────────────",
+    "",
+)
+_INSTRUMENT_MENU_TEXT = "\n".join(_INSTRUMENT_MENU_LINES) + "\n"  # Static menu texts are joined once at import
+
+
 def select_instrument(state: AppState, cfg: dict[str, str], log: TeeLogger) -> bool:
     """Select instrument menu (port of Bash select_instrument)."""
 
     _ = (cfg,)
     while True:
-        log.writeln("")
-        log.writeln("")
-        log.writeln("─────────────────────────────────────────────────────────────────────")
-        log.writeln("Specify Spectrophotometer Model")
-        log.writeln("─────────────────────────────────────────────────────────────────────")
-        log.writeln("")
-        log.writeln("This affects how the target chart is generated.")
-        log.writeln("")
-        log.writeln("1: i1Pro")
-        log.writeln("2: i1Pro3+")
-        log.writeln("3: ColorMunki")
-        log.writeln("4: DTP20")
-        log.writeln("5: DTP22")
-        log.writeln("6: DTP41")
-        log.writeln("7: DTP51")
-        log.writeln("8: SpectroScan")
-        log.writeln("9: Abort creating target.")
-        log.writeln("")
-        log.writeln("Notes:")
-        log.writeln("  - A menu of target chart options will be presented next step.")
-        log.writeln("  - Option '3: ColorMunki' has a separate configurable menu from the rest.")
-        log.writeln("  - The menu option and command arguments for targen and printtarg may be")
-        log.writeln("    edited in .ini file.")
-        log.writeln("")
-        log.writeln("─────────────────────────────────────────────────────────────────────")
-        log.writeln("")
+        log.write(_INSTRUMENT_MENU_TEXT)
 
-        print('Enter your choice [1-9]: ', end='', flush=True)
+        log.prompt('Enter your choice [1-9]: ')
         answer = getch()
-        print(answer, flush=True)
+        print(answer)
 
-        if not re.fullmatch(r"[1-9]", answer or ""):
+        if not _MENU19_RE.fullmatch(answer or ""):
             log.writeln("")
             log.writeln("❌ Invalid choice. Please enter a number from 1 to 9.")
             log.writeln("")
@@ -1066,125 +1670,158 @@ def select_instrument(state: AppState, cfg: dict[str, str], log: TeeLogger) -> b
     return True
 
 
-def specify_and_generate_target(state: AppState, cfg: dict[str, str], log: TeeLogger) -> bool:
-    """Target generation menu and targen/printtarg execution."""
+_TARGET_SIZE_LABELS = {1: "Small", 2: "Medium (default)", 3: "Large", 4: "XL", 5: "XXL", 6: "XXXL"}
 
-    def menu_info_common_settings() -> None:
-        log.writeln("Common settings for targen defined in setup file: ")
-        log.writeln(f"      - Arguments set: {cfg.get('COMMON_ARGUMENTS_TARGEN', '')}")
-        log.writeln(f"      - Ink limit -l: {cfg.get('INK_LIMIT', '')}")
-        log.writeln("      - Pre-conditioning profile specified -c:")
-        log.writeln(f"        '{cfg.get('PRECONDITIONING_PROFILE_PATH', '')}'")
-        log.writeln("Common settings for printtarg defined in setup file: ")
-        log.writeln(f"      - Arguments set: {cfg.get('COMMON_ARGUMENTS_PRINTTARG', '')}")
-        log.writeln(
-            f"      - Paper size -p: {cfg.get('PAPER_SIZE', '')}, Target resolution -T: {cfg.get('TARGET_RESOLUTION', '')} dpi"
-        )
-        log.writeln("Common settings for chartread defined in setup file: ")
-        log.writeln(f"      - Arguments set: {cfg.get('COMMON_ARGUMENTS_CHARTREAD', '')}")
-        log.writeln(
-            f"      - Patch consistency tolerance per strip -T: {cfg.get('STRIP_PATCH_CONSISTENSY_TOLERANCE', '')}"
-        )
-        log.writeln("Common settings for coprof defined in setup file: ")
-        log.writeln(f"      - Arguments set: {cfg.get('COMMON_ARGUMENTS_COLPROF', '')}")
-        log.writeln(f"      - Average deviation/smooting -r: {cfg.get('PROFILE_SMOOTING', '')}")
-        log.writeln("      - Color space profile specified, gamut mapping -S:")
-        log.writeln(f"        '{cfg.get('PRINTER_ICC_PATH', '')}'")
-        log.writeln("")
-        log.writeln("Notes on generating target charts:")
-        log.writeln("")
-        log.writeln(
-            "  When making targets with argyllcms targen, often two very light coloured patches"
-        )
-        log.writeln(
-            "  come next to each other (especially if there are multiple white patches), and targen"
-        )
-        log.writeln(
-            "  leaves the spacer between them also white (not black as it should be), which then"
-        )
-        log.writeln("  results in error “Not enough few patches” during reading of chart.")
-        log.writeln(
-            "  To prevent this, review the targets before printing to see if any light colored patches"
-        )
-        log.writeln(
-            "  are next to each other, and if the spacer is close in color. If there are, re-generate"
-        )
-        log.writeln(
-            "  the targets until it is acceptable. If this situation persists, this may be reason to"
-        )
-        log.writeln(
-            "  choose a pre-made target (option 3. in main menu)."
-        )
-        log.writeln("")
 
-    def menu_info_other_instruments() -> None:
-        for i in range(1, 7):
-            pc = cfg.get(f"INST_OTHER_MENU_OPTION{i}_PATCH_COUNT_f", "")
-            desc = cfg.get(f"INST_OTHER_MENU_OPTION{i}_DESCRIPTION", "")
-            log.writeln(f"{i}: {pc} patches {desc}")
-        log.writeln("7: Custom – Specify arugments independend of setup parameters")
-        log.writeln("8: Abort printing target.")
+def build_selection_table(cfg: dict[str, str]) -> dict[tuple[str, str, int], dict[str, str]]:
+    """Build the target size menu entries, keyed by (instrument, paper, option 1–6).
 
-    def default_target() -> dict[str, str]:
-        # This function ports the default_target() selection logic.
-        paper = cfg.get("PAPER_SIZE", "")
-        inst_name = state.inst_name
+    Instrument is "ColorMunki" or "Other", paper is "A4", "Letter" or "Other".
+    """
 
-        if inst_name == "ColorMunki":
-            if paper == "A4":
-                patch_count = cfg.get("INST_CM_MENU_OPTION2_PATCH_COUNT_A4_f", "")
-            elif paper == "Letter":
-                patch_count = cfg.get("INST_CM_MENU_OPTION2_PATCH_COUNT_LETTER_f", "")
+    table: dict[tuple[str, str, int], dict[str, str]] = {}
+    for inst in ("ColorMunki", "Other"):
+        for paper in ("A4", "Letter", "Other"):
+            # Instrument/page optimized entries only exist for ColorMunki on A4/Letter
+            if inst == "ColorMunki" and paper != "Other":
+                prefix = "INST_CM_MENU_OPTION"
+                patch_suffix = f"_PATCH_COUNT_{paper.upper()}_f"
             else:
-                patch_count = cfg.get("INST_OTHER_MENU_OPTION2_PATCH_COUNT_f", "")
-
-            if paper in {"A4", "Letter"}:
-                suffix = "A4" if paper == "A4" else "LETTER"
-                return {
-                    "label": "Medium (default)",
-                    "patch_count": patch_count,
-                    "white_patches": cfg.get(f"INST_CM_MENU_OPTION2_WHITE_PATCHES_e", ""),
-                    "black_patches": cfg.get(f"INST_CM_MENU_OPTION2_BLACK_PATCHES_B", ""),
-                    "gray_steps": cfg.get(f"INST_CM_MENU_OPTION2_GRAY_STEPS_g", ""),
-                    "multi_cube_steps": cfg.get(f"INST_CM_MENU_OPTION2_MULTI_CUBE_STEPS_m", ""),
-                    "multi_cube_surface_steps": cfg.get(f"INST_CM_MENU_OPTION2_MULTI_CUBE_SURFACE_STEPS_M", ""),
-                    "scale_patch_and_spacer": cfg.get(f"INST_CM_MENU_OPTION2_SCALE_PATCH_AND_SPACER_a", ""),
-                    "scale_spacer": cfg.get(f"INST_CM_MENU_OPTION2_SCALE_SPACER_A", ""),
-                    "layout_seed": cfg.get(f"INST_CM_MENU_OPTION2_LAYOUT_SEED_R", ""),
+                prefix = "INST_OTHER_MENU_OPTION"
+                patch_suffix = "_PATCH_COUNT_f"
+            for i in range(1, 7):
+                table[(inst, paper, i)] = {
+                    "label": _TARGET_SIZE_LABELS[i],
+                    "patch_count": cfg.get(f"{prefix}{i}{patch_suffix}", ""),
+                    "white_patches": cfg.get(f"{prefix}{i}_WHITE_PATCHES_e", ""),
+                    "black_patches": cfg.get(f"{prefix}{i}_BLACK_PATCHES_B", ""),
+                    "gray_steps": cfg.get(f"{prefix}{i}_GRAY_STEPS_g", ""),
+                    "multi_cube_steps": cfg.get(f"{prefix}{i}_MULTI_CUBE_STEPS_m", ""),
+                    "multi_cube_surface_steps": cfg.get(f"{prefix}{i}_MULTI_CUBE_SURFACE_STEPS_M", ""),
+                    "scale_patch_and_spacer": cfg.get(f"{prefix}{i}_SCALE_PATCH_AND_SPACER_a", ""),
+                    "scale_spacer": cfg.get(f"{prefix}{i}_SCALE_SPACER_A", ""),
+                    # Layout seed is always read from the ColorMunki entries
+                    "layout_seed": cfg.get(f"INST_CM_MENU_OPTION{i}_LAYOUT_SEED_R", ""),
                 }
-            return {
-                "label": "Medium (default)",
-                "patch_count": patch_count,
-                "white_patches": cfg.get("INST_OTHER_MENU_OPTION2_WHITE_PATCHES_e", ""),
-                "black_patches": cfg.get("INST_OTHER_MENU_OPTION2_BLACK_PATCHES_B", ""),
-                "gray_steps": cfg.get("INST_OTHER_MENU_OPTION2_GRAY_STEPS_g", ""),
-                "multi_cube_steps": cfg.get("INST_OTHER_MENU_OPTION2_MULTI_CUBE_STEPS_m", ""),
-                "multi_cube_surface_steps": cfg.get("INST_OTHER_MENU_OPTION2_MULTI_CUBE_SURFACE_STEPS_M", ""),
-                "scale_patch_and_spacer": cfg.get("INST_OTHER_MENU_OPTION2_SCALE_PATCH_AND_SPACER_a", ""),
-                "scale_spacer": cfg.get("INST_OTHER_MENU_OPTION2_SCALE_SPACER_A", ""),
-                "layout_seed": cfg.get("INST_CM_MENU_OPTION2_LAYOUT_SEED_R", ""),
-            }
-
-        return {
-            "label": "Medium (default)",
-            "patch_count": cfg.get("INST_OTHER_MENU_OPTION2_PATCH_COUNT_f", ""),
-            "white_patches": cfg.get("INST_OTHER_MENU_OPTION2_WHITE_PATCHES_e", ""),
-            "black_patches": cfg.get("INST_OTHER_MENU_OPTION2_BLACK_PATCHES_B", ""),
-            "gray_steps": cfg.get("INST_OTHER_MENU_OPTION2_GRAY_STEPS_g", ""),
-            "multi_cube_steps": cfg.get("INST_OTHER_MENU_OPTION2_MULTI_CUBE_STEPS_m", ""),
-            "multi_cube_surface_steps": cfg.get("INST_OTHER_MENU_OPTION2_MULTI_CUBE_SURFACE_STEPS_M", ""),
-            "scale_patch_and_spacer": cfg.get("INST_OTHER_MENU_OPTION2_SCALE_PATCH_AND_SPACER_a", ""),
-            "scale_spacer": cfg.get("INST_OTHER_MENU_OPTION2_SCALE_SPACER_A", ""),
-            "layout_seed": cfg.get("INST_CM_MENU_OPTION2_LAYOUT_SEED_R", ""),
-        }
+    return table
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class TargetCfg:
+    """Setup values read while building and running targen/printtarg."""
+
+    PAPER_SIZE: str = ""
+    INK_LIMIT: str = ""
+    PRECONDITIONING_PROFILE_PATH: str = ""
+    TARGET_RESOLUTION: str = ""
+    USE_LAYOUT_SEED_FOR_TARGET: str = ""
+    DEFAULT_TARGEN_COMMAND_CUSTOM: str = ""
+    DEFAULT_PRINTTARG_COMMAND_CUSTOM: str = ""
+    ENABLE_AUTO_OPEN_IMAGES_WITH_COLOR_SYNC_MAC: str = ""
+    COLOR_SYNC_UTILITY_PATH: str = ""
+
+
+def make_target_cfg(cfg: dict[str, str]) -> TargetCfg:
+    """Return the TargetCfg view of cfg (missing keys become "")."""
+
+    return TargetCfg(
+        PAPER_SIZE=cfg.get("PAPER_SIZE", ""),
+        INK_LIMIT=cfg.get("INK_LIMIT", ""),
+        PRECONDITIONING_PROFILE_PATH=cfg.get("PRECONDITIONING_PROFILE_PATH", ""),
+        TARGET_RESOLUTION=cfg.get("TARGET_RESOLUTION", ""),
+        USE_LAYOUT_SEED_FOR_TARGET=cfg.get("USE_LAYOUT_SEED_FOR_TARGET", ""),
+        DEFAULT_TARGEN_COMMAND_CUSTOM=cfg.get("DEFAULT_TARGEN_COMMAND_CUSTOM", ""),
+        DEFAULT_PRINTTARG_COMMAND_CUSTOM=cfg.get("DEFAULT_PRINTTARG_COMMAND_CUSTOM", ""),
+        ENABLE_AUTO_OPEN_IMAGES_WITH_COLOR_SYNC_MAC=cfg.get("ENABLE_AUTO_OPEN_IMAGES_WITH_COLOR_SYNC_MAC", ""),
+        COLOR_SYNC_UTILITY_PATH=cfg.get("COLOR_SYNC_UTILITY_PATH", ""),
+    )
+
+
+# Setup summary shown above the target size menu, filled from cfg (missing keys render empty)
+_COMMON_SETTINGS_TMPL = """\
+Common settings for targen defined in setup file: 
+      - Arguments set: {COMMON_ARGUMENTS_TARGEN}
+      - Ink limit -l: {INK_LIMIT}
+      - Pre-conditioning profile specified -c:
+        '{PRECONDITIONING_PROFILE_PATH}'
+Common settings for printtarg defined in setup file: 
+      - Arguments set: {COMMON_ARGUMENTS_PRINTTARG}
+      - Paper size -p: {PAPER_SIZE}, Target resolution -T: {TARGET_RESOLUTION} dpi
+Common settings for chartread defined in setup file: 
+      - Arguments set: {COMMON_ARGUMENTS_CHARTREAD}
+      - Patch consistency tolerance per strip -T: {STRIP_PATCH_CONSISTENSY_TOLERANCE}
+Common settings for coprof defined in setup file: 
+      - Arguments set: {COMMON_ARGUMENTS_COLPROF}
+      - Average deviation/smooting -r: {PROFILE_SMOOTING}
+      - Color space profile specified, gamut mapping -S:
+        '{PRINTER_ICC_PATH}'
+
+Notes on generating target charts:
+
+  When making targets with argyllcms targen, often two very light coloured patches
+  come next to each other (especially if there are multiple white patches), and targen
+  leaves the spacer between them also white (not black as it should be), which then
+  results in error “Not enough few patches” during reading of chart.
+  To prevent this, review the targets before printing to see if any light colored patches
+  are next to each other, and if the spacer is close in color. If there are, re-generate
+  the targets until it is acceptable. If this situation persists, this may be reason to
+  choose a pre-made target (option 3. in main menu).
+
+"""
+
+_CUSTOM_ARGS_VALID_LINES = (
+    "Valid values: Letters A–Z a–z, digits 0–9, dash -, underscore _, ",
+    "              parentheses ( ), forward slash /, space, dot .",
+)
+
+
+def build_target_menu(
+    inst_name: str, cfg: dict[str, str], selections: dict[tuple[str, str, int], dict[str, str]]
+) -> tuple[str, dict[str, dict[str, str]]]:
+    """Render the target size menu for inst_name and the paper size in cfg.
+
+    Returns the menu text and the selection entries for options "1"–"6".
+    """
+
+    paper = cfg.get("PAPER_SIZE", "")
+    lines = [""]
+    if inst_name == "ColorMunki" and paper in {"A4", "Letter"}:
+        lines.append(f"Below menu choices have been optimized for page size {paper} and {inst_name} instrument.")
+        desc_key = f"INST_CM_MENU_OPTION{{i}}_{paper.upper()}_DESCRIPTION"
+    else:
+        if inst_name == "ColorMunki":
+            lines.append(f"⚠️ Non-standard printer paper size: PAPER_SIZE \"{paper}\".")
+            lines.append("USING INSTRUMENT/PAGE INDEPENDENT MENU-PARAMETERS (STARTING WITH INST_OTHER_*).")
+            lines.append("")
+        lines.append("Number of created pages increase with patch count, depending on settings.")
+        desc_key = "INST_OTHER_MENU_OPTION{i}_DESCRIPTION"
+    lines.append(_COMMON_SETTINGS_TMPL.format_map(defaultdict(str, cfg)))
+    lines.append("Select the target size:")
+    lines.append("")
+
+    key = ("ColorMunki" if inst_name == "ColorMunki" else "Other", paper if paper in {"A4", "Letter"} else "Other")
+    options: dict[str, dict[str, str]] = {}
+    for i in range(1, 7):
+        options[str(i)] = selections[(*key, i)]
+        lines.append(f"{i}: {options[str(i)]['patch_count']} patches {cfg.get(desc_key.format(i=i), '')}")
+    lines.append("7: Custom – Specify arugments independend of setup parameters")
+    lines.append("8: Abort printing target.")
+    lines.append("")
+    return "\n".join(lines) + "\n", options
+
+
+def specify_and_generate_target(state: AppState, cfg: dict[str, str], log: TeeLogger) -> bool:
+    """Target generation menu and targen/printtarg execution."""
+
+    CFG = state.target_cfg or make_target_cfg(cfg)
 
     def _targen_args_from_selection(sel: dict[str, str], targen_command_custom: str, is_custom: bool) -> list[str]:
         if is_custom:
-            args = _split_cfg_args(targen_command_custom)
+            args = list(_split_cfg_args(targen_command_custom))
         else:
-            args = _split_cfg_args(cfg.get("COMMON_ARGUMENTS_TARGEN", ""))
+            args = list(_common_args(state, cfg, "COMMON_ARGUMENTS_TARGEN"))
 
-            ink_limit = cfg.get("INK_LIMIT", "")
+            ink_limit = CFG.INK_LIMIT
             if ink_limit:
                 args.append(f"-l{ink_limit}")
 
@@ -1201,37 +1838,37 @@ def specify_and_generate_target(state: AppState, cfg: dict[str, str], log: TeeLo
             if sel.get("patch_count", ""):
                 args.append(f"-f{sel['patch_count']}")
 
-        precon = cfg.get("PRECONDITIONING_PROFILE_PATH", "")
+        precon = CFG.PRECONDITIONING_PROFILE_PATH
         if precon:
-            p = Path(precon).expanduser()
-            if not p.is_file():
+            precon_resolved = resolve_profile_path(state, precon)
+            if precon_resolved is None:
                 log.writeln(f"⚠️ Warning: Pre-conditioning profile not found: '{precon}'")
                 log.writeln("   Skipping pre-conditioning profile in targen.")
             else:
-                args.extend(["-c", str(p.resolve())])
+                args.extend(["-c", precon_resolved])
 
         args.append(state.name)
         return ["targen", *args]
 
     def _printtarg_args_from_selection(sel: dict[str, str], printtarg_command_custom: str, is_custom: bool) -> list[str]:
         if is_custom:
-            args = _split_cfg_args(printtarg_command_custom)
+            args = list(_split_cfg_args(printtarg_command_custom))
             args.append(state.name)
             return ["printtarg", *args]
 
-        args = _split_cfg_args(cfg.get("COMMON_ARGUMENTS_PRINTTARG", ""))
+        args = list(_common_args(state, cfg, "COMMON_ARGUMENTS_PRINTTARG"))
         args.extend(_split_cfg_args(state.inst_arg))
 
-        if cfg.get("USE_LAYOUT_SEED_FOR_TARGET", "").lower() == "true":
+        if CFG.USE_LAYOUT_SEED_FOR_TARGET.lower() == "true":
             layout_seed = sel.get("layout_seed", "")
             if layout_seed:
                 args.append(f"-R{layout_seed}")
 
-        target_res = cfg.get("TARGET_RESOLUTION", "")
+        target_res = CFG.TARGET_RESOLUTION
         if target_res:
             args.append(f"-T{target_res}")
 
-        paper = cfg.get("PAPER_SIZE", "")
+        paper = CFG.PAPER_SIZE
         if paper:
             args.append(f"-p{paper}")
 
@@ -1245,70 +1882,20 @@ def specify_and_generate_target(state: AppState, cfg: dict[str, str], log: TeeLo
 
     # ----------------------------- Target selection menu -----------------------------
     label = ""
-    targen_command_custom = cfg.get("DEFAULT_TARGEN_COMMAND_CUSTOM", "")
-    printtarg_command_custom = cfg.get("DEFAULT_PRINTTARG_COMMAND_CUSTOM", "")
+    targen_command_custom = CFG.DEFAULT_TARGEN_COMMAND_CUSTOM
+    printtarg_command_custom = CFG.DEFAULT_PRINTTARG_COMMAND_CUSTOM
     selection: dict[str, str] = {}
     is_custom = False
+    selections = state.selections or build_selection_table(cfg)
 
-    while True:
-        paper = cfg.get("PAPER_SIZE", "")
-        if state.inst_name == "ColorMunki":
-            if paper == "A4":
-                log.writeln("")
-                log.writeln(
-                    f"Below menu choices have been optimized for page size {paper} and {state.inst_name} instrument."
-                )
-                menu_info_common_settings()
-                log.writeln("")
-                log.writeln("Select the target size:")
-                log.writeln("")
-                for i in range(1, 7):
-                    pc = cfg.get(f"INST_CM_MENU_OPTION{i}_PATCH_COUNT_A4_f", "")
-                    desc = cfg.get(f"INST_CM_MENU_OPTION{i}_A4_DESCRIPTION", "")
-                    log.writeln(f"{i}: {pc} patches {desc}")
-                log.writeln("7: Custom – Specify arugments independend of setup parameters")
-                log.writeln("8: Abort printing target.")
-            elif paper == "Letter":
-                log.writeln("")
-                log.writeln(
-                    f"Below menu choices have been optimized for page size {paper} and {state.inst_name} instrument."
-                )
-                menu_info_common_settings()
-                log.writeln("")
-                log.writeln("Select the target size:")
-                log.writeln("")
-                for i in range(1, 7):
-                    pc = cfg.get(f"INST_CM_MENU_OPTION{i}_PATCH_COUNT_LETTER_f", "")
-                    desc = cfg.get(f"INST_CM_MENU_OPTION{i}_LETTER_DESCRIPTION", "")
-                    log.writeln(f"{i}: {pc} patches {desc}")
-                log.writeln("7: Custom – Specify arugments independend of setup parameters")
-                log.writeln("8: Abort printing target.")
-            else:
-                log.writeln("")
-                log.writeln(f"⚠️ Non-standard printer paper size: PAPER_SIZE \"{paper}\".")
-                log.writeln(
-                    "USING INSTRUMENT/PAGE INDEPENDENT MENU-PARAMETERS (STARTING WITH INST_OTHER_*)."
-                )
-                log.writeln("")
-                log.writeln("Number of created pages increase with patch count, depending on settings.")
-                menu_info_common_settings()
-                log.writeln("")
-                log.writeln("Select the target size:")
-                log.writeln("")
-                menu_info_other_instruments()
-        else:
-            log.writeln("")
-            log.writeln("Number of created pages increase with patch count, depending on settings.")
-            menu_info_common_settings()
-            log.writeln("")
-            log.writeln("Select the target size:")
-            log.writeln("")
-            menu_info_other_instruments()
+    # Instrument and paper size do not change while in this menu, so render it once
+    menu_text, option_selections = build_target_menu(state.inst_name, cfg, selections)
 
-        log.writeln("")
-        print("Enter your choice [1–8]: ", end='', flush=True)
+    while True:
+        log.write(menu_text)
+        log.prompt("Enter your choice [1–8]: ")
         patch_choice = getch()
-        print(patch_choice, flush=True)
+        print(patch_choice)
 
         if patch_choice == "8":
             log.writeln("Aborting printing target.")
@@ -1318,70 +1905,58 @@ def specify_and_generate_target(state: AppState, cfg: dict[str, str], log: TeeLo
             # Custom arguments
             is_custom = True
 
+            precon = CFG.PRECONDITIONING_PROFILE_PATH
+            if precon:
+                precon_lines = ["       - Current pre-conditioning profile specified -c:", f"         '{precon}'"]
+            else:
+                precon_lines = ["       - Pre-conditioning profile is currently not specified in setup."]
+            targen_prompt = [
+                "",
+                "",
+                "Specify targen command arguments:",
+                "Default value specified:",
+                f"'{CFG.DEFAULT_TARGEN_COMMAND_CUSTOM}'",
+                "",
+                "Notes: - Arguments -l and -c are programatically selected",
+                "         (unless empty '' in setup) and should not be specified below.",
+                *precon_lines,
+                f"       - Current ink limit specified -l: '{CFG.INK_LIMIT}'",
+                "       - For more information on targen arguments, see argyllcms manual.",
+                "",
+                *_CUSTOM_ARGS_VALID_LINES,
+            ]
             while True:
-                log.writeln("")
-                log.writeln("")
-                log.writeln("Specify targen command arguments:")
-                log.writeln("Default value specified:")
-                log.writeln(f"'{cfg.get('DEFAULT_TARGEN_COMMAND_CUSTOM', '')}'")
-                log.writeln("")
-                log.writeln(
-                    "Notes: - Arguments -l and -c are programatically selected"
-                )
-                log.writeln(
-                    "         (unless empty '' in setup) and should not be specified below."
-                )
-                precon = cfg.get("PRECONDITIONING_PROFILE_PATH", "")
-                if precon:
-                    log.writeln("       - Current pre-conditioning profile specified -c:")
-                    log.writeln(f"         '{precon}'")
-                else:
-                    log.writeln("       - Pre-conditioning profile is currently not specified in setup.")
-                log.writeln(f"       - Current ink limit specified -l: '{cfg.get('INK_LIMIT', '')}'")
-                log.writeln("       - For more information on targen arguments, see argyllcms manual.")
-                log.writeln("")
-                log.writeln(
-                    "Valid values: Letters A–Z a–z, digits 0–9, dash -, underscore _, "
-                )
-                log.writeln(
-                    "              parentheses ( ), forward slash /, space, dot ."
-                )
+                log.write_block(targen_prompt)
                 entered = input("Enter/modify arguments or enter to use default: ")
                 if not entered:
-                    targen_command_custom = cfg.get("DEFAULT_TARGEN_COMMAND_CUSTOM", "")
+                    targen_command_custom = CFG.DEFAULT_TARGEN_COMMAND_CUSTOM
                     break
-                if not re.fullmatch(r"[A-Za-z0-9._()\/\-\s]+", entered):
+                if not _ARG_RE.fullmatch(entered):
                     log.writeln("❌ Invalid characters. Please try again.")
                     continue
                 targen_command_custom = entered
                 break
 
+            printtarg_prompt = [
+                "",
+                "",
+                "Specify printtarg command arguments:",
+                "Default value specified:",
+                f"'{CFG.DEFAULT_PRINTTARG_COMMAND_CUSTOM}'",
+                "",
+                "Note: - Previously selected instrument (-i), resolution (-T) ",
+                "        and page size (-p) must be specified again if desired.",
+                "      - For more information on printtarg arguments, see argyllcms manual.",
+                "",
+                *_CUSTOM_ARGS_VALID_LINES,
+            ]
             while True:
-                log.writeln("")
-                log.writeln("")
-                log.writeln("Specify printtarg command arguments:")
-                log.writeln("Default value specified:")
-                log.writeln(f"'{cfg.get('DEFAULT_PRINTTARG_COMMAND_CUSTOM', '')}'")
-                log.writeln("")
-                log.writeln(
-                    "Note: - Previously selected instrument (-i), resolution (-T) "
-                )
-                log.writeln(
-                    "        and page size (-p) must be specified again if desired."
-                )
-                log.writeln("      - For more information on printtarg arguments, see argyllcms manual.")
-                log.writeln("")
-                log.writeln(
-                    "Valid values: Letters A–Z a–z, digits 0–9, dash -, underscore _, "
-                )
-                log.writeln(
-                    "              parentheses ( ), forward slash /, space, dot ."
-                )
+                log.write_block(printtarg_prompt)
                 entered = input("Enter/modify arguments or enter to use default: ")
                 if not entered:
-                    printtarg_command_custom = cfg.get("DEFAULT_PRINTTARG_COMMAND_CUSTOM", "")
+                    printtarg_command_custom = CFG.DEFAULT_PRINTTARG_COMMAND_CUSTOM
                     break
-                if not re.fullmatch(r"[A-Za-z0-9._()\/\-\s]+", entered):
+                if not _ARG_RE.fullmatch(entered):
                     log.writeln("❌ Invalid characters. Please try again.")
                     continue
                 printtarg_command_custom = entered
@@ -1392,49 +1967,20 @@ def specify_and_generate_target(state: AppState, cfg: dict[str, str], log: TeeLo
         else:
             is_custom = False
 
-            if patch_choice not in {"1", "2", "3", "4", "5", "6"}:
-                selection = default_target()
+            if patch_choice not in option_selections:
+                selection = option_selections["2"]
                 label = selection["label"]
                 log.writeln("Invalid selection. Using default.")
             else:
-                i = int(patch_choice)
-                # Use instrument-specific or other-instrument keys
-                if state.inst_name == "ColorMunki" and cfg.get("PAPER_SIZE", "") in {"A4", "Letter"}:
-                    patch_key = f"INST_CM_MENU_OPTION{i}_PATCH_COUNT_{cfg.get('PAPER_SIZE', '').upper()}_f"
-                    patch_count = cfg.get(patch_key, "")
-                    selection = {
-                        "label": {1: "Small", 2: "Medium (default)", 3: "Large", 4: "XL", 5: "XXL", 6: "XXXL"}[i],
-                        "patch_count": patch_count,
-                        "white_patches": cfg.get(f"INST_CM_MENU_OPTION{i}_WHITE_PATCHES_e", ""),
-                        "black_patches": cfg.get(f"INST_CM_MENU_OPTION{i}_BLACK_PATCHES_B", ""),
-                        "gray_steps": cfg.get(f"INST_CM_MENU_OPTION{i}_GRAY_STEPS_g", ""),
-                        "multi_cube_steps": cfg.get(f"INST_CM_MENU_OPTION{i}_MULTI_CUBE_STEPS_m", ""),
-                        "multi_cube_surface_steps": cfg.get(f"INST_CM_MENU_OPTION{i}_MULTI_CUBE_SURFACE_STEPS_M", ""),
-                        "scale_patch_and_spacer": cfg.get(f"INST_CM_MENU_OPTION{i}_SCALE_PATCH_AND_SPACER_a", ""),
-                        "scale_spacer": cfg.get(f"INST_CM_MENU_OPTION{i}_SCALE_SPACER_A", ""),
-                        "layout_seed": cfg.get(f"INST_CM_MENU_OPTION{i}_LAYOUT_SEED_R", ""),
-                    }
-                else:
-                    selection = {
-                        "label": {1: "Small", 2: "Medium (default)", 3: "Large", 4: "XL", 5: "XXL", 6: "XXXL"}[i],
-                        "patch_count": cfg.get(f"INST_OTHER_MENU_OPTION{i}_PATCH_COUNT_f", ""),
-                        "white_patches": cfg.get(f"INST_OTHER_MENU_OPTION{i}_WHITE_PATCHES_e", ""),
-                        "black_patches": cfg.get(f"INST_OTHER_MENU_OPTION{i}_BLACK_PATCHES_B", ""),
-                        "gray_steps": cfg.get(f"INST_OTHER_MENU_OPTION{i}_GRAY_STEPS_g", ""),
-                        "multi_cube_steps": cfg.get(f"INST_OTHER_MENU_OPTION{i}_MULTI_CUBE_STEPS_m", ""),
-                        "multi_cube_surface_steps": cfg.get(f"INST_OTHER_MENU_OPTION{i}_MULTI_CUBE_SURFACE_STEPS_M", ""),
-                        "scale_patch_and_spacer": cfg.get(f"INST_OTHER_MENU_OPTION{i}_SCALE_PATCH_AND_SPACER_a", ""),
-                        "scale_spacer": cfg.get(f"INST_OTHER_MENU_OPTION{i}_SCALE_SPACER_A", ""),
-                        "layout_seed": cfg.get(f"INST_CM_MENU_OPTION{i}_LAYOUT_SEED_R", ""),
-                    }
+                selection = option_selections[patch_choice]
                 label = selection["label"]
 
         log.writeln("")
         if label != "Custom":
             log.writeln(f"Selected target: {label} – {selection.get('patch_count', '')} patches")
         else:
-            precon = cfg.get("PRECONDITIONING_PROFILE_PATH", "")
-            targen_l = f" -l{cfg.get('INK_LIMIT', '')}" if cfg.get("INK_LIMIT", "") else ""
+            precon = CFG.PRECONDITIONING_PROFILE_PATH
+            targen_l = f" -l{CFG.INK_LIMIT}" if CFG.INK_LIMIT else ""
             targen_c = f" -c \"{precon}\"" if precon else ""
             log.writeln("Selected target: - Custom")
             log.writeln(f"                 - targen arguments: {targen_command_custom}{targen_l}{targen_c}")
@@ -1442,9 +1988,9 @@ def specify_and_generate_target(state: AppState, cfg: dict[str, str], log: TeeLo
 
         while True:
             log.writeln("")
-            print("Do you want to continue with selected target? [y/n]: ", end='', flush=True)
+            log.prompt("Do you want to continue with selected target? [y/n]: ")
             again = getch()
-            print(again, flush=True)
+            print(again)
             if again.lower() == "y":
                 log.writeln("")
                 log.writeln("Continuing with selected target...")
@@ -1488,11 +2034,11 @@ def specify_and_generate_target(state: AppState, cfg: dict[str, str], log: TeeLo
         log.writeln(f"  {f.name}")
     log.writeln("")
 
-    if state.PLATFORM == "macos" and cfg.get("ENABLE_AUTO_OPEN_IMAGES_WITH_COLOR_SYNC_MAC", "").lower() == "true":
+    if state.PLATFORM == "macos" and CFG.ENABLE_AUTO_OPEN_IMAGES_WITH_COLOR_SYNC_MAC.lower() == "true":
         log.writeln("Please print the test chart(s) and make sure to disable color management.")
         log.writeln("Created Images will open automatically in ColorSync Utility.")
         log.writeln('In the Printer dialog set option "Colour" to "Print as Color Target".')
-        app = cfg.get("COLOR_SYNC_UTILITY_PATH", "")
+        app = CFG.COLOR_SYNC_UTILITY_PATH
         if app:
             open_cmd = ["open", "-a", app, *[str(p) for p in state.tif_files]]
             run_cmd(open_cmd, log)
@@ -1509,9 +2055,9 @@ def specify_and_generate_target(state: AppState, cfg: dict[str, str], log: TeeLo
     log.writeln("After target(s) have been printed...")
     log.writeln("")
     while True:
-        print("Do you want to continue with measuring of target? [y/n]: ", end='', flush=True)
+        log.prompt("Do you want to continue with measuring of target? [y/n]: ")
         again = getch()
-        print(again, flush=True)
+        print(again)
         if again.lower() == "y":
             log.writeln("")
             log.writeln("Continuing with measuring of target...")
@@ -1537,13 +2083,18 @@ def check_files_in_new_location_after_copy(state: AppState, cfg: dict[str, str],
     profile_folder = Path(state.profile_folder)
     missing_files = False
 
+    # One directory pass for the .ti2/.ti3 checks and the TIFF lookup
+    ti2_name = f"{state.name}.ti2"
+    ti3_name = f"{state.name}.ti3"
+    present = {ti2_name: False, ti3_name: False}
+    tif_files = _collect_matching_tifs(profile_folder, state.name, present)
+
     # Check .ti2, applicable for action 2+3
     if state.action != "4":
-        if not (profile_folder / f"{state.name}.ti2").is_file():
+        if not present[ti2_name]:
             log.writeln(f"❌ Missing {state.name}.ti2 in {str(profile_folder)}")
             missing_files = True
 
-        tif_files = _collect_matching_tifs(profile_folder, state.name)
         if not tif_files:
             log.writeln(f"❌ No TIFF files found in {str(profile_folder)}")
             missing_files = True
@@ -1551,7 +2102,7 @@ def check_files_in_new_location_after_copy(state: AppState, cfg: dict[str, str],
             state.tif_files = tif_files
 
     if state.action in {"2", "4"}:
-        if not (profile_folder / f"{state.name}.ti3").is_file():
+        if not present[ti3_name]:
             log.writeln(f"❌ Missing {state.name}.ti3 in {str(profile_folder)}")
             missing_files = True
 
@@ -1561,109 +2112,145 @@ def check_files_in_new_location_after_copy(state: AppState, cfg: dict[str, str],
     return True
 
 
+# Static ΔE2000 quick reference table
+_DE_REFERENCE_LINES = (
+    "Delta E 2000 (Real-World Accuracy After Profiling)",
+    "──────────────────────────────────────────────────────────────────────────────",
+    "                             Typical       Typical          Typical",
+    "Printer Class                ΔE2000        Substrates       Use Cases",
+    "──────────────────────────────────────────────────────────────────────────────",
+    "Professional Photo Inkjet    Avg 0.5-1.5   Gloss,           Gallery,",
+    "  Example Models:            95% 1.5-2.5   baryta,          contract proofing",
+    "  Epson P700/P900/P9570,     Max 3-5       fine art",
+    "  Canon PRO-1000, HP Z9+",
+    "",
+    "Prosumer / High-End Inkjet   Avg 0.8-2.0   Premium gloss,   Serious hobby,",
+    "  Example Models:            95% 2.0-3.5   semi-gloss,      small studio",
+    "  Epson P600/P800,           Max 4-7",
+    "  Canon PRO-200/300",
+    "",
+    "Consumer Home Inkjet         Avg 1.5-3.0   Glossy, matte,   Casual photo,",
+    "  Example Models:            95% 3.0-5.0   plain            mixed docs",
+    "  Canon PIXMA TS/MG,         Max 6-10",
+    "  Epson EcoTank/Expression",
+    "",
+    "Professional Laser /         Avg 1.5-2.5   Coated stock,    Corporate,",
+    "Production                   95% 3.0-4.0   proof paper      marketing,",
+    "  Example Models:            Max 5-7                        light proof",
+    "  Xerox PrimeLink,",
+    "  Canon imagePRESS",
+    "  Ricoh Pro C",
+    "",
+    "Office / Consumer Laser      Avg 2.5-5.0   Office bond,     Business docs,",
+    "  Example Models:            95% 4.0-7.0   coated office    presentations",
+    "  HP Color LaserJet Pro,     Max 7-12+",
+    "  Brother HL/MFC",
+    "  Canon i-SENSYS",
+    "",
+    "──────────────────────────────────────────────────────────────────────────────",
+    "",
+    "Notes:",
+    "   • Values assume proper ICC profiling and correct media settings",
+    "   • Avg = overall accuracy, 95% = typical worst case, Max = outliers",
+    "   • Lower ΔE = higher color accuracy",
+    "   • ΔE < 1.0 is generally considered visually indistinguishable",
+    "   • Source of these numbers: https://ChatGPT.com",
+    "",
+)
+_DE_REFERENCE_TEXT = "\n".join(_DE_REFERENCE_LINES) + "\n"
+
+
 def show_de_reference(state: AppState, cfg: dict[str, str], log: TeeLogger) -> None:
     """Print ΔE reference table (port of Bash show_de_reference)."""
 
     _ = (state, cfg)
-    log.writeln("Delta E 2000 (Real-World Accuracy After Profiling)")
-    log.writeln("──────────────────────────────────────────────────────────────────────────────")
-    log.writeln("                             Typical       Typical          Typical")
-    log.writeln("Printer Class                ΔE2000        Substrates       Use Cases")
-    log.writeln("──────────────────────────────────────────────────────────────────────────────")
-    log.writeln("Professional Photo Inkjet    Avg 0.5-1.5   Gloss,           Gallery,")
-    log.writeln("  Example Models:            95% 1.5-2.5   baryta,          contract proofing")
-    log.writeln("  Epson P700/P900/P9570,     Max 3-5       fine art")
-    log.writeln("  Canon PRO-1000, HP Z9+")
-    log.writeln("")
-    log.writeln("Prosumer / High-End Inkjet   Avg 0.8-2.0   Premium gloss,   Serious hobby,")
-    log.writeln("  Example Models:            95% 2.0-3.5   semi-gloss,      small studio")
-    log.writeln("  Epson P600/P800,           Max 4-7")
-    log.writeln("  Canon PRO-200/300")
-    log.writeln("")
-    log.writeln("Consumer Home Inkjet         Avg 1.5-3.0   Glossy, matte,   Casual photo,")
-    log.writeln("  Example Models:            95% 3.0-5.0   plain            mixed docs")
-    log.writeln("  Canon PIXMA TS/MG,         Max 6-10")
-    log.writeln("  Epson EcoTank/Expression")
-    log.writeln("")
-    log.writeln("Professional Laser /         Avg 1.5-2.5   Coated stock,    Corporate,")
-    log.writeln("Production                   95% 3.0-4.0   proof paper      marketing,")
-    log.writeln("  Example Models:            Max 5-7                        light proof")
-    log.writeln("  Xerox PrimeLink,")
-    log.writeln("  Canon imagePRESS")
-    log.writeln("  Ricoh Pro C")
-    log.writeln("")
-    log.writeln("Office / Consumer Laser      Avg 2.5-5.0   Office bond,     Business docs,")
-    log.writeln("  Example Models:            95% 4.0-7.0   coated office    presentations")
-    log.writeln("  HP Color LaserJet Pro,     Max 7-12+")
-    log.writeln("  Brother HL/MFC")
-    log.writeln("  Canon i-SENSYS")
-    log.writeln("")
-    log.writeln("──────────────────────────────────────────────────────────────────────────────")
-    log.writeln("")
-    log.writeln("Notes:")
-    log.writeln("   • Values assume proper ICC profiling and correct media settings")
-    log.writeln("   • Avg = overall accuracy, 95% = typical worst case, Max = outliers")
-    log.writeln("   • Lower ΔE = higher color accuracy")
-    log.writeln("   • ΔE < 1.0 is generally considered visually indistinguishable")
-    log.writeln("   • Source of these numbers: https://ChatGPT.com")
-    log.writeln("")
+    log.write(_DE_REFERENCE_TEXT)
+
+
+# Static tips shown for improving profile accuracy
+_ACCURACY_TIPS_LINES = (
+    "",
+    "",
+    "",
+    "────────────────────────────────────────────────────────────────",
+    "Tips on how to improve accuracy of a profile",
+    "────────────────────────────────────────────────────────────────",
+    "",
+    "  1. The top-most lines in the file '*_sanity_check.txt, created'",
+    "     after a profile is made, are the patches with higest ΔE values.",
+    "",
+    "  2. If ΔE values are too large it is recommended to remeasure.",
+    "      - ΔE > 2 is regarded as clearly visible difference and",
+    "         should be remeasured (depending on printer type, see",
+    "         Quick Reference table below or menu option 8).",
+    "      - ΔE < 1 is considered visually indistinguishable.",
+    "",
+    "  3. The 'Largest ΔE' or 'max.' value is an indicator that some",
+    "     patches should be remeasured.",
+    "",
+    "  4. When wanting to remeasure patches to improve overall profile",
+    "     quality, do the following: ",
+    "      a. Open file '*_sanity_check.txt' of a created printer",
+    "         profile and identify which sheets have largest error.",
+    "         Look at patch ID and find column label on target chart.",
+    "      b. In main menu, chose option 3, then select the target used",
+    "         for your profile by selecting",
+    "         the .ti2 file (files and targets should be in the folder",
+    "         where your .icc is stored)",
+    "      c. Select option '1. Create new profile (copy files into",
+    "         new folder)'. Do not overwrite.",
+    "      d. Start reading only those strips where high error has been",
+    "         identified. ",
+    "         Press 'f' to move forward, or 'b' to move back one strip",
+    "         at a time while reading.",
+    "      e. When you have read the appropriate target strips, select",
+    "         ‘d’ to save and exit.",
+    "      f. Open the created .ti3 file, and also the original .ti3",
+    "         for your profile to be improved.",
+    "         The new .ti3 file has data for read patches below the tag",
+    "         'BEGIN_DATA', and contain only the lines you re-read.",
+    "      g. In the original .ti3 file, search for the patch IDs to",
+    "         identify the lines to replace.",
+    "         Copy one data line at a time from the new .ti3 file, and",
+    "         replace the line with same ID in the original .ti3 file.",
+    "         Then save file.",
+    "      h. Now choose option 4 in main menu. Select the updated .ti3",
+    "         file. Now a new .icc profile and and sanity report is",
+    "         created. Study results and see if the profile is improved.",
+    "",
+    "────────────────────────────────────────────────────────────────",
+    "",
+)
+_ACCURACY_TIPS_TEXT = "\n".join(_ACCURACY_TIPS_LINES) + "\n"
 
 
 def improving_accuracy(state: AppState, cfg: dict[str, str], log: TeeLogger) -> None:
     """Print accuracy improvement tips (port of Bash improving_accuracy)."""
 
     _ = (state, cfg)
-    log.writeln("")
-    log.writeln("")
-    log.writeln("")
-    log.writeln("────────────────────────────────────────────────────────────────")
-    log.writeln("Tips on how to improve accuracy of a profile")
-    log.writeln("────────────────────────────────────────────────────────────────")
-    log.writeln("")
-    log.writeln("  1. The top-most lines in the file '*_sanity_check.txt, created'")
-    log.writeln("     after a profile is made, are the patches with higest ΔE values.")
-    log.writeln("")
-    log.writeln("  2. If ΔE values are too large it is recommended to remeasure.")
-    log.writeln("      - ΔE > 2 is regarded as clearly visible difference and")
-    log.writeln("         should be remeasured (depending on printer type, see")
-    log.writeln("         Quick Reference table below or menu option 8).")
-    log.writeln("      - ΔE < 1 is considered visually indistinguishable.")
-    log.writeln("")
-    log.writeln("  3. The 'Largest ΔE' or 'max.' value is an indicator that some")
-    log.writeln("     patches should be remeasured.")
-    log.writeln("")
-    log.writeln("  4. When wanting to remeasure patches to improve overall profile")
-    log.writeln("     quality, do the following: ")
-    log.writeln("      a. Open file '*_sanity_check.txt' of a created printer")
-    log.writeln("         profile and identify which sheets have largest error.")
-    log.writeln("         Look at patch ID and find column label on target chart.")
-    log.writeln("      b. In main menu, chose option 3, then select the target used")
-    log.writeln("         for your profile by selecting")
-    log.writeln("         the .ti2 file (files and targets should be in the folder")
-    log.writeln("         where your .icc is stored)")
-    log.writeln("      c. Select option '1. Create new profile (copy files into")
-    log.writeln("         new folder)'. Do not overwrite.")
-    log.writeln("      d. Start reading only those strips where high error has been")
-    log.writeln("         identified. ")
-    log.writeln("         Press 'f' to move forward, or 'b' to move back one strip")
-    log.writeln("         at a time while reading.")
-    log.writeln("      e. When you have read the appropriate target strips, select")
-    log.writeln("         ‘d’ to save and exit.")
-    log.writeln("      f. Open the created .ti3 file, and also the original .ti3")
-    log.writeln("         for your profile to be improved.")
-    log.writeln("         The new .ti3 file has data for read patches below the tag")
-    log.writeln("         'BEGIN_DATA', and contain only the lines you re-read.")
-    log.writeln("      g. In the original .ti3 file, search for the patch IDs to")
-    log.writeln("         identify the lines to replace.")
-    log.writeln("         Copy one data line at a time from the new .ti3 file, and")
-    log.writeln("         replace the line with same ID in the original .ti3 file.")
-    log.writeln("         Then save file.")
-    log.writeln("      h. Now choose option 4 in main menu. Select the updated .ti3")
-    log.writeln("         file. Now a new .icc profile and and sanity report is")
-    log.writeln("         created. Study results and see if the profile is improved.")
-    log.writeln("")
-    log.writeln("────────────────────────────────────────────────────────────────")
-    log.writeln("")
+    log.write(_ACCURACY_TIPS_TEXT)
+
+
+# Static submenu shown after the sanity check
+_SANITY_SUBMENU_LINES = (
+    "",
+    "",
+    "─────────────────────────────────────────────────────────────────────────",
+    "What would you like to do?",
+    "─────────────────────────────────────────────────────────────────────────",
+    "",
+    "1) Show tips on how to improve accuracy of a profile",
+    "2) Show ΔE2000 Color Accuracy — Quick Reference",
+    "3) Return to main menu",
+    "",
+    "─────────────────────────────────────────────────────────────────────────",
+    "",
+)
+_SANITY_SUBMENU_TEXT = "\n".join(_SANITY_SUBMENU_LINES) + "\n"
+
+
+# profcheck -s result line, e.g. "[1.234] @ ..." (matched on raw bytes of complete lines)
+_DE_RE = re.compile(rb"^[^\S\n]*\[([0-9]+\.[0-9]+)\][^@\n]*@", re.MULTILINE)
 
 
 def sanity_check(state: AppState, cfg: dict[str, str], log: TeeLogger) -> bool:
@@ -1677,112 +2264,127 @@ def sanity_check(state: AppState, cfg: dict[str, str], log: TeeLogger) -> bool:
     log.writeln("")
 
     log.writeln("Command Used: profcheck -v2 -k -s")
-    # Run profcheck and redirect to file
+    # The sanity file stays open (with a large buffer) for both profcheck runs and
+    # the appended analysis. The first run's output is piped through Python, written
+    # to the file and parsed for ΔE lines in the same pass; Python's buffer is flushed
+    # before the second run writes to the shared descriptor. Binary mode lets the ΔE
+    # lines be matched without decoding every line.
     import subprocess
-    with open(sanity_file, "w") as f:
-        proc = subprocess.run(
+    with open(sanity_file, "w+b", buffering=1 << 17) as f:
+
+        def _append(text: str) -> None:
+            f.write(text.replace("\n", os.linesep).encode("utf-8"))
+
+        proc = subprocess.Popen(
             ["profcheck", "-v2", "-k", "-s", f"{state.name}.ti3", f"{state.name}.icc"],
-            stdout=f,
+            stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            text=True,
+            bufsize=_RUN_CMD_PIPE_BUFSIZE,
         )
-    if proc.returncode != 0:
-        log.writeln("")
-        log.writeln("❌ profcheck failed. See log for details.")
-        log.writeln("")
-        return False
+        assert proc.stdout is not None
+        # Tee the output into the file and extract delta E values from each run of
+        # complete lines; a trailing partial line is kept for the next chunk.
+        delta_e_values: list[float] = []
+        pending = b""
+        while True:
+            chunk = proc.stdout.read1(_RUN_CMD_CHUNK_SIZE)
+            if not chunk:
+                break
+            f.write(chunk)
+            data = pending + chunk
+            end = data.rfind(b"\n") + 1
+            if end:
+                delta_e_values.extend(float(m.group(1)) for m in _DE_RE.finditer(data, 0, end))
+            pending = data[end:]
+        if pending:
+            delta_e_values.extend(float(m.group(1)) for m in _DE_RE.finditer(pending))
+        proc.stdout.close()
+        proc.wait()
+        if proc.returncode != 0:
+            log.writeln("")
+            log.writeln("❌ profcheck failed. See log for details.")
+            log.writeln("")
+            return False
 
-    # Append empty lines
-    with open(sanity_file, "a") as f:
-        f.write("\n\n")
+        # Append empty lines
+        _append("\n\n")
 
-    # Extract delta E values
-    delta_e_values = []
-    with open(sanity_file, "r") as f:
-        for line in f:
-            m = re.search(r'^\[([0-9]+\.[0-9]+)\].*@', line.strip())
-            if m:
-                delta_e_values.append(float(m.group(1)))
+        if not delta_e_values:
+            log.writeln("⚠️ No delta E values found in sanity check file")
+            return False
 
-    if not delta_e_values:
-        log.writeln("⚠️ No delta E values found in sanity check file")
-        return False
+        # Since profcheck -s sorts highest to lowest
+        largest = delta_e_values[0]
+        smallest = delta_e_values[-1]
+        range_val = largest - smallest
 
-    # Since profcheck -s sorts highest to lowest
-    largest = delta_e_values[0]
-    smallest = delta_e_values[-1]
-    range_val = largest - smallest
-
-    total_patches = len(delta_e_values)
-
-    # Calculate percentiles (round up)
-    import math
-    pos_99 = math.ceil(total_patches * 0.99)
-    pos_98 = math.ceil(total_patches * 0.98)
-    pos_95 = math.ceil(total_patches * 0.95)
-    pos_90 = math.ceil(total_patches * 0.90)
-
-    # Get values from end (since sorted high to low)
-    def get_percentile(pos):
-        if pos > 0 and pos <= total_patches:
-            return delta_e_values[total_patches - pos]
-        return "N/A"
-
-    percentile_99 = get_percentile(pos_99)
-    percentile_98 = get_percentile(pos_98)
-    percentile_95 = get_percentile(pos_95)
-    percentile_90 = get_percentile(pos_90)
-
-    # Count <1, <2, <3
-    count_lt_1 = sum(1 for v in delta_e_values if v < 1.0)
-    count_lt_2 = sum(1 for v in delta_e_values if v < 2.0)
-    count_lt_3 = sum(1 for v in delta_e_values if v < 3.0)
-
-    percent_lt_1 = (count_lt_1 / total_patches) * 100
-    percent_lt_2 = (count_lt_2 / total_patches) * 100
-    percent_lt_3 = (count_lt_3 / total_patches) * 100
-
-    # Display results
-    log.writeln("")
-    log.writeln("Delta E Range Analysis:")
-    log.writeln(f"  Largest ΔE:  {largest}")
-    log.writeln(f"  Smallest ΔE: {smallest}")
-    log.writeln("")
-    log.writeln("Percentile Values:")
-    log.writeln(f"  99th percentile: {percentile_99}")
-    log.writeln(f"  98th percentile: {percentile_98}")
-    log.writeln(f"  95th percentile: {percentile_95}")
-    log.writeln(f"  90th percentile: {percentile_90}")
-    log.writeln("")
-    log.writeln("Patch Count Analysis:")
-    log.writeln(f"  Percent of patches with ΔE<1.0: {percent_lt_1:.1f}%")
-    log.writeln(f"  Percent of patches with ΔE<2.0: {percent_lt_2:.1f}%")
-    log.writeln(f"  Percent of patches with ΔE<3.0: {percent_lt_3:.1f}%")
-    log.writeln("")
+        total_patches = len(delta_e_values)
+
+        # Percentiles (rank rounded up, integer ceil), read from the end since sorted high to low
+        percentile_99, percentile_98, percentile_95, percentile_90 = (
+            delta_e_values[total_patches - (-(-total_patches * pct // 100))]
+            for pct in (99, 98, 95, 90)
+        )
 
-    # Append to file
-    with open(sanity_file, "a") as f:
-        f.write("\n")
-        f.write("=== Delta E Range Analysis ===\n")
-        f.write(f"Largest ΔE: {largest}\n")
-        f.write(f"Smallest ΔE: {smallest}\n")
-        f.write("\n")
-        f.write("Percentile Values:\n")
-        f.write(f"99th percentile: {percentile_99}\n")
-        f.write(f"98th percentile: {percentile_98}\n")
-        f.write(f"95th percentile: {percentile_95}\n")
-        f.write(f"90th percentile: {percentile_90}\n")
-        f.write("\n")
-        f.write("Patch Count Analysis:\n")
-        f.write(f"Percent of patches with ΔE<1.0: {percent_lt_1:.1f}%\n")
-        f.write(f"Percent of patches with ΔE<2.0: {percent_lt_2:.1f}%\n")
-        f.write(f"Percent of patches with ΔE<3.0: {percent_lt_3:.1f}%\n")
-        f.write("================================\n")
-        f.write("\n")
-
-    # Run another profcheck and append
-    log.writeln("Command Used: profcheck -v -k")
-    with open(sanity_file, "a") as f:
+        # Count <1, <2, <3 in one pass (the thresholds are nested)
+        count_lt_1 = count_lt_2 = count_lt_3 = 0
+        for v in delta_e_values:
+            if v < 3.0:
+                count_lt_3 += 1
+                if v < 2.0:
+                    count_lt_2 += 1
+                    if v < 1.0:
+                        count_lt_1 += 1
+
+        percent_lt_1 = (count_lt_1 / total_patches) * 100
+        percent_lt_2 = (count_lt_2 / total_patches) * 100
+        percent_lt_3 = (count_lt_3 / total_patches) * 100
+
+        # Display results
+        log.write_block([
+            "",
+            "Delta E Range Analysis:",
+            f"  Largest ΔE:  {largest}",
+            f"  Smallest ΔE: {smallest}",
+            "",
+            "Percentile Values:",
+            f"  99th percentile: {percentile_99}",
+            f"  98th percentile: {percentile_98}",
+            f"  95th percentile: {percentile_95}",
+            f"  90th percentile: {percentile_90}",
+            "",
+            "Patch Count Analysis:",
+            f"  Percent of patches with ΔE<1.0: {percent_lt_1:.1f}%",
+            f"  Percent of patches with ΔE<2.0: {percent_lt_2:.1f}%",
+            f"  Percent of patches with ΔE<3.0: {percent_lt_3:.1f}%",
+            "",
+        ])
+
+        # Append to file
+        _append("\n".join([
+            "",
+            "=== Delta E Range Analysis ===",
+            f"Largest ΔE: {largest}",
+            f"Smallest ΔE: {smallest}",
+            "",
+            "Percentile Values:",
+            f"99th percentile: {percentile_99}",
+            f"98th percentile: {percentile_98}",
+            f"95th percentile: {percentile_95}",
+            f"90th percentile: {percentile_90}",
+            "",
+            "Patch Count Analysis:",
+            f"Percent of patches with ΔE<1.0: {percent_lt_1:.1f}%",
+            f"Percent of patches with ΔE<2.0: {percent_lt_2:.1f}%",
+            f"Percent of patches with ΔE<3.0: {percent_lt_3:.1f}%",
+            "================================",
+            "",
+            "",
+        ]))
+
+        # Run another profcheck and append
+        log.writeln("Command Used: profcheck -v -k")
+        f.flush()
         proc2 = subprocess.run(
             ["profcheck", "-v", "-k", f"{state.name}.ti3", f"{state.name}.icc"],
             stdout=f,
@@ -1803,22 +2405,11 @@ def sanity_check(state: AppState, cfg: dict[str, str], log: TeeLogger) -> bool:
 
     # Submenu
     while True:
-        log.writeln("")
-        log.writeln("")
-        log.writeln("─────────────────────────────────────────────────────────────────────────")
-        log.writeln("What would you like to do?")
-        log.writeln("─────────────────────────────────────────────────────────────────────────")
-        log.writeln("")
-        log.writeln("1) Show tips on how to improve accuracy of a profile")
-        log.writeln("2) Show ΔE2000 Color Accuracy — Quick Reference")
-        log.writeln("3) Return to main menu")
-        log.writeln("")
-        log.writeln("─────────────────────────────────────────────────────────────────────────")
-        log.writeln("")
+        log.write(_SANITY_SUBMENU_TEXT)
 
-        print("Enter your choice [1-3]: ", end='', flush=True)
+        log.prompt("Enter your choice [1-3]: ")
         choice = getch()
-        print(choice, flush=True)
+        print(choice)
 
         if choice == "1":
             log.writeln("")
@@ -1840,10 +2431,30 @@ def sanity_check(state: AppState, cfg: dict[str, str], log: TeeLogger) -> bool:
     return True
 
 
-def file_mtime(path: Path) -> int:
-    """Get modification time as integer seconds since epoch."""
+def file_mtime(path: str | Path) -> int:
+    """Get modification time as integer nanoseconds since epoch."""
+
+    return os.stat(path).st_mtime_ns
+
 
-    return int(path.stat().st_mtime)
+# Setup keys whose non-empty values are passed to colprof as <flag><value>
+_COLPROF_FLAGS = (("INK_LIMIT", "-l"), ("PROFILE_SMOOTING", "-r"))
+
+
+def build_colprof_args(state: AppState, cfg: dict[str, str], log: TeeLogger) -> list[str]:
+    """Build the colprof arguments shared by both profile creation paths (without -D/name)."""
+
+    colprof_args = ["colprof", *_common_args(state, cfg, "COMMON_ARGUMENTS_COLPROF")]
+    colprof_args += [f"{flag}{cfg[key]}" for key, flag in _COLPROF_FLAGS if cfg.get(key)]
+    printer_icc = cfg.get("PRINTER_ICC_PATH", "")
+    if printer_icc:
+        printer_icc_resolved = resolve_profile_path(state, printer_icc)
+        if printer_icc_resolved is None:
+            log.writeln(f"⚠️ Warning: Printer ICC profile not found: '{printer_icc}'")
+            log.writeln("   Skipping printer ICC profile in colprof.")
+        else:
+            colprof_args.extend(["-S", printer_icc_resolved])
+    return colprof_args
 
 
 def perform_measurement_and_profile_creation(state: AppState, cfg: dict[str, str], log: TeeLogger) -> bool:
@@ -1860,9 +2471,9 @@ def perform_measurement_and_profile_creation(state: AppState, cfg: dict[str, str
     log.writeln("Please connect the spectrophotometer.")
     log.writeln("")
     while True:
-        print("Continue? [y/n]: ", end='', flush=True)
+        log.prompt("Continue? [y/n]: ")
         again = getch()
-        print(again, flush=True)
+        print(again)
         if again.lower() == "y":
             log.writeln("")
             log.writeln("Starting chart reading (read .ti2 file and generate .ti3 file)...")
@@ -1895,18 +2506,18 @@ def perform_measurement_and_profile_creation(state: AppState, cfg: dict[str, str
         log.writeln("     - Save progress once in a while with 'd' and then")
         log.writeln("       resume measuring with option 2 of main menu.")
 
-    ti3_file = Path(f"{state.name}.ti3")
+    ti3_file = f"{state.name}.ti3"
 
     # Resume mode (action 2): detect abort by unchanged mtime
     ti3_mtime_before: Optional[int] = None
-    if state.action == "2" and ti3_file.exists():
+    if state.action == "2" and os.path.exists(ti3_file):
         ti3_mtime_before = file_mtime(ti3_file)
 
     log.writeln("")
     common_text_tips()
     log.writeln("")
 
-    chartread_args = ["chartread", *_split_cfg_args(cfg.get("COMMON_ARGUMENTS_CHARTREAD", ""))]
+    chartread_args = ["chartread", *_common_args(state, cfg, "COMMON_ARGUMENTS_CHARTREAD")]
     if state.action == "2":
         # Bash: chartread ${COMMON_ARGUMENTS_CHARTREAD} -r${chartread_T} "${name}"
         # where chartread_T is built as " -T<value>" (leading space) => becomes: -r -T<value>
@@ -1925,10 +2536,11 @@ def perform_measurement_and_profile_creation(state: AppState, cfg: dict[str, str
         log.writeln("")
         return False
 
+    ti3_exists = os.path.exists(ti3_file)
     if state.action == "2":
-        if not ti3_file.exists() or ti3_mtime_before is None:
+        if not ti3_exists or ti3_mtime_before is None:
             # If file didn't exist before, fallback to existence check
-            if not ti3_file.exists():
+            if not ti3_exists:
                 log.writeln("")
                 log.writeln("⚠️️ Chartread aborted by user.")
                 log.writeln("")
@@ -1941,33 +2553,19 @@ def perform_measurement_and_profile_creation(state: AppState, cfg: dict[str, str
                 log.writeln("")
                 return False
     else:
-        if not ti3_file.exists():
+        if not ti3_exists:
             log.writeln("")
             log.writeln("⚠️️ Chartread aborted by user.")
             log.writeln("")
             return False
 
     # --- Build colprof arguments conditionally ---------------------------
-    colprof_args = ["colprof", *_split_cfg_args(cfg.get("COMMON_ARGUMENTS_COLPROF", ""))]
-    ink_limit = cfg.get("INK_LIMIT", "")
-    if ink_limit:
-        colprof_args.append(f"-l{ink_limit}")
-    smoothing = cfg.get("PROFILE_SMOOTING", "")
-    if smoothing:
-        colprof_args.append(f"-r{smoothing}")
-    printer_icc = cfg.get("PRINTER_ICC_PATH", "")
-    if printer_icc:
-        p = Path(printer_icc).expanduser()
-        if not p.is_file():
-            log.writeln(f"⚠️ Warning: Printer ICC profile not found: '{printer_icc}'")
-            log.writeln("   Skipping printer ICC profile in colprof.")
-        else:
-            colprof_args.extend(["-S", str(p.resolve())])
+    colprof_args = build_colprof_args(state, cfg, log)
 
     log.writeln("")
-    print("Do you want to continue creating profile with resulting ti3 file? [y/n]: ", end='', flush=True)
+    log.prompt("Do you want to continue creating profile with resulting ti3 file? [y/n]: ")
     cont = getch()
-    print(cont, flush=True)
+    print(cont)
     if cont.lower() != "y":
         log.writeln("")
         log.writeln("Profile creation aborted by user...")
@@ -1998,21 +2596,7 @@ def create_profile_from_existing(state: AppState, cfg: dict[str, str], log: TeeL
     """Create ICC from existing .ti3 (port of Bash create_profile_from_existing)."""
 
     # --- Build colprof arguments conditionally ---------------------------
-    colprof_args = ["colprof", *_split_cfg_args(cfg.get("COMMON_ARGUMENTS_COLPROF", ""))]
-    ink_limit = cfg.get("INK_LIMIT", "")
-    if ink_limit:
-        colprof_args.append(f"-l{ink_limit}")
-    smoothing = cfg.get("PROFILE_SMOOTING", "")
-    if smoothing:
-        colprof_args.append(f"-r{smoothing}")
-    printer_icc = cfg.get("PRINTER_ICC_PATH", "")
-    if printer_icc:
-        p = Path(printer_icc).expanduser()
-        if not p.is_file():
-            log.writeln(f"⚠️ Warning: Printer ICC profile not found: '{printer_icc}'")
-            log.writeln("   Skipping printer ICC profile in colprof.")
-        else:
-            colprof_args.extend(["-S", str(p.resolve())])
+    colprof_args = build_colprof_args(state, cfg, log)
 
     log.writeln("")
     log.writeln("")
@@ -2058,7 +2642,12 @@ def install_profile_and_save_data(state: AppState, cfg: dict[str, str], log: Tee
         return False
 
     dest = Path(dest_dir).expanduser()
-    if not dest.is_dir():
+    # One stat for the directory check, reused for the permissions shown below
+    try:
+        dest_st: Optional[os.stat_result] = dest.stat()
+    except OSError:
+        dest_st = None
+    if dest_st is None or not stat.S_ISDIR(dest_st.st_mode):
         log.writeln("")
         log.writeln(f"❌ Destination directory does not exist: '{dest_dir}'")
         log.writeln("   Check PRINTER_PROFILES_PATH in the setup file.")
@@ -2080,11 +2669,7 @@ def install_profile_and_save_data(state: AppState, cfg: dict[str, str], log: Tee
                 log.writeln(f"        e.g. sudo cp '{src.name}' '{dest_dir}/'")
             log.writeln("")
             log.writeln("   Current permissions:")
-            try:
-                st = dest.stat()
-                log.writeln(f"   mode: {oct(st.st_mode)}")
-            except OSError:
-                pass
+            log.writeln(f"   mode: {oct(dest_st.st_mode)}")
         else:
             log.writeln("   Suggested macOS user profile folder:")
             log.writeln("     '$HOME/Library/ColorSync/Profiles'")
@@ -2092,7 +2677,7 @@ def install_profile_and_save_data(state: AppState, cfg: dict[str, str], log: Tee
         return False
 
     try:
-        shutil.copy2(src, dest / src.name)
+        _fast_copy(src, dest / src.name)
     except OSError:
         log.writeln("")
         log.writeln(f"❌ Failed to copy ICC profile to '{dest_dir}'.")
@@ -2112,53 +2697,56 @@ def install_profile_and_save_data(state: AppState, cfg: dict[str, str], log: Tee
 def edit_setup_parameters(state: AppState, cfg: dict[str, str], log: TeeLogger) -> None:
     """Interactive edit of setup parameters (port of Bash edit_setup_parameters)."""
 
-    cfg = load_setup_file_shell_style(state.setup_file)
-    validate_cfg_paths(cfg, log)
-
+    # cfg was just loaded and validated by main_menu; edits below update it in place
+    # and on disk, and only path changes need validating again.
+    # Current naming example for option 6, rebuilt only when that value changes
+    naming_display = f"Current value specified:\n'{cfg.get('EXAMPLE_FILE_NAMING', '')}'"
     while True:
         icc_filename = Path(cfg.get("PRINTER_ICC_PATH", "")).name
         precon_icc_filename = Path(cfg.get("PRECONDITIONING_PROFILE_PATH", "")).name
 
-        log.writeln("")
-        log.writeln("")
-        log.writeln("")
-        log.writeln("─────────────────────────────────────────────────────────────────────")
-        log.writeln("Change Setup Parameters - Sub-Menu ")
-        log.writeln("─────────────────────────────────────────────────────────────────────")
-        log.writeln("")
-        log.writeln("In this menu some variables stored in the $setup_file file ")
-        log.writeln("can be modified. For other parameters modify the file in a text editor.")
-        log.writeln("")
-        log.writeln("What parameter do you want to modify?")
-        log.writeln("")
-        log.writeln("1: Select Color Space profile to use when creating printer profile.")
-        log.writeln("   (gamut mapping to output profile)")
-        log.writeln(f"   Current file specified: '{icc_filename}'")
-        log.writeln("")
-        log.writeln("2: Select pre-conditioning profile to use when creating target.")
-        log.writeln(f"   Current file specified: '{precon_icc_filename}'")
-        log.writeln("")
-        log.writeln("3: Modify patch consistency tolerance (chartread arg. -T)")
-        log.writeln(f"   Current value specified: '{cfg.get('STRIP_PATCH_CONSISTENSY_TOLERANCE', '')}'")
-        log.writeln("")
-        log.writeln("4: Modify paper size for target generation (printtarg -p). Valid values: A4, Letter.")
-        log.writeln(f"   Current value specified: '{cfg.get('PAPER_SIZE', '')}'")
-        log.writeln("")
-        log.writeln("5: Modify ink limit (targen and colprof -l). Valid values: 0 – 400 (%) or empty to disable.")
-        log.writeln(f"   Current value specified: '{cfg.get('INK_LIMIT', '')}'")
-        log.writeln("")
-        log.writeln("6: Modify file naming convention example (shown in main menu option 1). Valid value: text.")
-        log.writeln("   Current value specified:")
-        log.writeln(f"   '{cfg.get('EXAMPLE_FILE_NAMING', '')}'")
-        log.writeln("")
-        log.writeln("7: Go back to main menu.")
-        log.writeln("")
-        log.writeln("─────────────────────────────────────────────────────────────────────")
-        log.writeln("")
-
-        print("Enter your choice [1–7]: ", end='', flush=True)
+        log.write_block([
+            "",
+            "",
+            "",
+            "─────────────────────────────────────────────────────────────────────",
+            "Change Setup Parameters - Sub-Menu ",
+            "─────────────────────────────────────────────────────────────────────",
+            "",
+            "In this menu some variables stored in the $setup_file file ",
+            "can be modified. For other parameters modify the file in a text editor.",
+            "",
+            "What parameter do you want to modify?",
+            "",
+            "1: Select Color Space profile to use when creating printer profile.",
+            "   (gamut mapping to output profile)",
+            f"   Current file specified: '{icc_filename}'",
+            "",
+            "2: Select pre-conditioning profile to use when creating target.",
+            f"   Current file specified: '{precon_icc_filename}'",
+            "",
+            "3: Modify patch consistency tolerance (chartread arg. -T)",
+            f"   Current value specified: '{cfg.get('STRIP_PATCH_CONSISTENSY_TOLERANCE', '')}'",
+            "",
+            "4: Modify paper size for target generation (printtarg -p). Valid values: A4, Letter.",
+            f"   Current value specified: '{cfg.get('PAPER_SIZE', '')}'",
+            "",
+            "5: Modify ink limit (targen and colprof -l). Valid values: 0 – 400 (%) or empty to disable.",
+            f"   Current value specified: '{cfg.get('INK_LIMIT', '')}'",
+            "",
+            "6: Modify file naming convention example (shown in main menu option 1). Valid value: text.",
+            "   Current value specified:",
+            f"   '{cfg.get('EXAMPLE_FILE_NAMING', '')}'",
+            "",
+            "7: Go back to main menu.",
+            "",
+            "─────────────────────────────────────────────────────────────────────",
+            "",
+        ])
+
+        log.prompt("Enter your choice [1–7]: ")
         answer = getch()
-        print(answer, flush=True)
+        print(answer)
 
         if answer == "1":
             state.action = "6"
@@ -2166,6 +2754,8 @@ def edit_setup_parameters(state: AppState, cfg: dict[str, str], log: TeeLogger)
                 new_path = state.new_icc_path
                 update_setup_value_shell_style(state.setup_file, "PRINTER_ICC_PATH", new_path)
                 cfg["PRINTER_ICC_PATH"] = new_path
+                state.resolved_icc_paths.clear()
+                validate_cfg_paths(cfg, log)
                 log.writeln("✅ Updated PRINTER_ICC_PATH")
             else:
                 log.writeln("Selection cancelled.")
@@ -2177,6 +2767,8 @@ def edit_setup_parameters(state: AppState, cfg: dict[str, str], log: TeeLogger)
                 new_path = state.new_icc_path
                 update_setup_value_shell_style(state.setup_file, "PRECONDITIONING_PROFILE_PATH", new_path)
                 cfg["PRECONDITIONING_PROFILE_PATH"] = new_path
+                state.resolved_icc_paths.clear()
+                validate_cfg_paths(cfg, log)
                 log.writeln("✅ Updated PRECONDITIONING_PROFILE_PATH")
             else:
                 log.writeln("Selection cancelled.")
@@ -2184,7 +2776,7 @@ def edit_setup_parameters(state: AppState, cfg: dict[str, str], log: TeeLogger)
 
         elif answer == "3":
             value = input("Enter new value [0.6 recommended]: ").strip()
-            if not re.fullmatch(r'^[0-9]+(\.[0-9]+)?$', value):
+            if not _NUM_RE.match(value):
                 log.writeln("❌ Invalid numeric value.")
                 continue
             update_setup_value_shell_style(state.setup_file, "STRIP_PATCH_CONSISTENSY_TOLERANCE", value)
@@ -2204,7 +2796,9 @@ def edit_setup_parameters(state: AppState, cfg: dict[str, str], log: TeeLogger)
 
         elif answer == "5":
             value = input("Enter ink limit (0–400 or empty to disable): ").strip()
-            if value and (not value.isdigit() or not (0 <= int(value) <= 400)):
+            # ASCII digits only: str.isdigit() alone also accepts e.g. "²", which int() rejects
+            valid = not value or (value.isascii() and value.isdigit() and int(value) <= 400)
+            if not valid:
                 log.writeln("❌ Invalid ink limit.")
                 continue
             update_setup_value_shell_style(state.setup_file, "INK_LIMIT", value)
@@ -2214,13 +2808,14 @@ def edit_setup_parameters(state: AppState, cfg: dict[str, str], log: TeeLogger)
 
         elif answer == "6":
             # Show the menu
-            print_profile_name_menu(log, cfg, "", show_example=False, current_display=f"Current value specified:\n'{cfg.get('EXAMPLE_FILE_NAMING', '')}'")
+            print_profile_name_menu(log, cfg, "", show_example=False, current_display=naming_display)
             value = input("Enter example file naming convention: ").strip()
-            if not re.fullmatch(r"[A-Za-z0-9._()\-]+", value):
+            if not _is_valid_filename(value):
                 log.writeln("❌ Invalid file name characters. Please try again.")
                 continue
             update_setup_value_shell_style(state.setup_file, "EXAMPLE_FILE_NAMING", value)
             cfg["EXAMPLE_FILE_NAMING"] = value
+            naming_display = f"Current value specified:\n'{value}'"
             log.writeln("")
             log.writeln("✅ Updated file naming convention example to:")
             log.writeln(value)
@@ -2238,79 +2833,222 @@ def edit_setup_parameters(state: AppState, cfg: dict[str, str], log: TeeLogger)
             continue
 
 
+# Startup banner, joined once at import (VERSION is a module constant)
+_BANNER_TEXT = "\n".join((
+    "==============================================================",
+    "    ___        _                        _           _ _       ",
+    "   / _ \\ _   _| |_ ___  _ __ ___   __ _| |_ ___  __| | |      ",
+    "  | | | | | | | __/ _ \\| '_ ` _ \\ / _` | __/ _ \\/ _` | |   ",
+    "  | |_| | |_| | || (_) | | | | | | (_| | ||  __/ (_| | |      ",
+    "   \\___/ \\__,_|\\__\\___/|_| |_| |_|\\__,_|\\__\\___|\\__,_|_|      ",
+    "                                                              ",
+    "        Argyll Printer Profiler (Automated Workflow)          ",
+    "          Color Target Generation & ICC Profiling             ",
+    "==============================================================",
+    "",
+    "Automated ArgyllCMS script for calibrating printers on Windows, macOS and Linux.",
+    "Targets are adapted for use with X-Rite Colormunki Photo / i1Studio.",
+    "",
+    "Author:  Knut Larsson",
+    f"Version: {VERSION}",
+    "",
+)) + "\n"
+
+
 def print_banner(log: TeeLogger) -> None:
     """Print the ASCII banner similar to the Bash version."""
 
-    log.writeln("==============================================================")
-    log.writeln("    ___        _                        _           _ _       ")
-    log.writeln("   / _ \\ _   _| |_ ___  _ __ ___   __ _| |_ ___  __| | |      ")
-    log.writeln("  | | | | | | | __/ _ \\| '_ ` _ \\ / _` | __/ _ \\/ _` | |   ")
-    log.writeln("  | |_| | |_| | || (_) | | | | | | (_| | ||  __/ (_| | |      ")
-    log.writeln("   \\___/ \\__,_|\\__\\___/|_| |_| |_|\\__,_|\\__\\___|\\__,_|_|      ")
-    log.writeln("                                                              ")
-    log.writeln("        Argyll Printer Profiler (Automated Workflow)          ")
-    log.writeln("          Color Target Generation & ICC Profiling             ")
-    log.writeln("==============================================================")
-    log.writeln("")
-    log.writeln("Automated ArgyllCMS script for calibrating printers on Windows, macOS and Linux.")
-    log.writeln("Targets are adapted for use with X-Rite Colormunki Photo / i1Studio.")
-    log.writeln("")
-    log.writeln("Author:  Knut Larsson")
-    log.writeln(f"Version: {VERSION}")
-    log.writeln("")
+    log.write(_BANNER_TEXT)
 
 
-def validate_cfg_paths(cfg: dict[str, str], log: TeeLogger) -> None:
-    """Validate paths in cfg for existence and validity, logging warnings if issues."""
+# Non-path setup variables that must be set
+_REQUIRED_VARS: tuple[str, ...] = (
+    "STRIP_PATCH_CONSISTENSY_TOLERANCE",
+    "COLOR_SYNC_UTILITY_PATH",
+    "PROFILE_SMOOTING",
+    "TARGET_RESOLUTION",
+)
 
-    # PRINTER_PROFILES_PATH: should be a directory
-    path_str = cfg.get("PRINTER_PROFILES_PATH", "").strip()
-    if not path_str:
-        log.writeln("⚠️ Warning: PRINTER_PROFILES_PATH is not specified in setup file.")
-    else:
-        path_str = os.path.expandvars(path_str)
-        p = Path(path_str).expanduser()
-        if not p.exists():
-            log.writeln(f"⚠️ Warning: PRINTER_PROFILES_PATH directory does not exist: '{path_str}'")
-        elif not p.is_dir():
-            log.writeln(f"⚠️ Warning: PRINTER_PROFILES_PATH is not a directory: '{path_str}'")
-
-    # PRECONDITIONING_PROFILE_PATH: should be a file
-    path_str = cfg.get("PRECONDITIONING_PROFILE_PATH", "").strip()
-    if path_str:
-        path_str = os.path.expandvars(path_str)
-        p = Path(path_str).expanduser()
-        if not p.exists():
-            log.writeln(f"⚠️ Warning: PRECONDITIONING_PROFILE_PATH file does not exist: '{path_str}'")
-        elif not p.is_file():
-            log.writeln(f"⚠️ Warning: PRECONDITIONING_PROFILE_PATH is not a file: '{path_str}'")
-    # else:
-        # Do nothing: accepted that path is empty
-
-    # PRINTER_ICC_PATH: should be a file
-    path_str = cfg.get("PRINTER_ICC_PATH", "").strip()
-    if not path_str:
-        log.writeln("⚠️ Warning: PRINTER_ICC_PATH is not specified in setup file.")
-    else:
+
+def validate_cfg_paths(cfg: dict[str, str], log: TeeLogger) -> list[str]:
+    """Validate paths in cfg for existence and validity, logging warnings if issues.
+
+    Returns the logged warning lines.
+    """
+
+    warnings: list[str] = []
+
+    # (key, must be a directory, empty value allowed); one stat per path tells
+    # both whether it exists and what kind it is
+    for key, want_dir, optional in (
+        ("PRINTER_PROFILES_PATH", True, False),
+        ("PRECONDITIONING_PROFILE_PATH", False, True),
+        ("PRINTER_ICC_PATH", False, False),
+    ):
+        path_str = cfg.get(key, "").strip()
+        if not path_str:
+            if not optional:
+                warnings.append(f"⚠️ Warning: {key} is not specified in setup file.")
+            continue
         path_str = os.path.expandvars(path_str)
-        p = Path(path_str).expanduser()
-        if not p.exists():
-            log.writeln(f"⚠️ Warning: PRINTER_ICC_PATH file does not exist: '{path_str}'")
-        elif not p.is_file():
-            log.writeln(f"⚠️ Warning: PRINTER_ICC_PATH is not a file: '{path_str}'")
+        kind = "directory" if want_dir else "file"
+        try:
+            st = os.stat(os.path.expanduser(path_str))
+        except (OSError, ValueError):
+            warnings.append(f"⚠️ Warning: {key} {kind} does not exist: '{path_str}'")
+            continue
+        if not (stat.S_ISDIR(st.st_mode) if want_dir else stat.S_ISREG(st.st_mode)):
+            warnings.append(f"⚠️ Warning: {key} is not a {kind}: '{path_str}'")
 
     # Check required non-path variables
-    required_vars = [
-        "STRIP_PATCH_CONSISTENSY_TOLERANCE",
-        "COLOR_SYNC_UTILITY_PATH",
-        "PROFILE_SMOOTING",
-        "TARGET_RESOLUTION",
-    ]
+    warnings.extend(
+        f"⚠️ Warning: Variable {var} not set. Check setup file."
+        for var in _REQUIRED_VARS
+        if not cfg.get(var, "").strip()
+    )
+
+    if warnings:
+        log.write_block(warnings)
+    return warnings
+
+
+# Main menu text, shown on every main menu iteration
+_MAIN_MENU_LINES = (
+    "",
+    "",
+    "─────────────────────────────────────────────────────────────────────────",
+    "Printer Profiling — Main Menu",
+    "─────────────────────────────────────────────────────────────────────────",
+    "General Notes:",
+    "   1. Existing ti1/ti2/ti3/icc and target image (.tif) filenames must match.",
+    "   2. If more than one target image, filenames must end with _01, _02, etc.",
+    "",
+    "",
+    "What action do you want to perform?",
+    "",
+    "1: Create target chart and printer profile from scratch",
+    "    └─ Specify name → Generate targets → Measure target patches",
+    "       → Create profile → Sanity check → Copy to profile folder",
+    "       (Cancel after generating targets if only target chart is needed)",
+    "",
+    "2: Resume or re-read an existing target chart measurement and create profile",
+    "    └─ Specify .ti3 file → Measure target patches",
+    "       → Create profile → Sanity check → Copy to profile folder",
+    "",
+    "3: Read an existing target chart from scratch and create profile",
+    "    └─ Specify .ti2 file → Measure target patches",
+    "       → Create profile → Sanity check → Copy to profile folder",
+    "",
+    "4: Create printer profile from an existing measurement file",
+    "    └─ Specify .ti3 file → Create profile → Sanity check",
+    "       → Copy to profile folder",
+    "",
+    "5: Perform sanity check on existing profile",
+    "    └─ Specify .ti3 file → Check profile against test chart data",
+    "       → Create report",
+    "",
+    "6: Change setup parameters",
+    "",
+    "7: Show tips on how to improve accuracy of a profile",
+    "",
+    "8: Show ΔE2000 Color Accuracy — Quick Reference",
+    "",
+    "9: Exit script",
+    "─────────────────────────────────────────────────────────────────────────",
+    "",
+)
+_MAIN_MENU_TEXT = "\n".join(_MAIN_MENU_LINES) + "\n"
+
+# Main menu actions 1-5: workflow steps run in order; a step returning False aborts
+_MENU_PIPELINES: dict[str, tuple[Callable[[AppState, dict[str, str], TeeLogger], bool], ...]] = {
+    "1": (
+        specify_profile_name,
+        select_instrument,
+        specify_and_generate_target,
+        perform_measurement_and_profile_creation,
+        install_profile_and_save_data,
+    ),
+    "2": (select_file, perform_measurement_and_profile_creation, install_profile_and_save_data),
+    "3": (select_file, perform_measurement_and_profile_creation, install_profile_and_save_data),
+    "4": (select_file, create_profile_from_existing, install_profile_and_save_data),
+    "5": (select_file, sanity_check),
+}
+
+# File dialog titles for the actions that start with select_file
+_MENU_DIALOG_TITLES = {
+    "2": "Select an existing .ti3 file to re-read/resume measuring target patches.",
+    "3": "Select an existing .ti2 file to measure target patches.",
+    "4": "Select an existing completed .ti3 file to create .icc profile with.",
+    "5": "Select an existing .ti3 file that has a matching .icc profile.",
+}
+
+# Main menu actions 7-8: static pages followed by a return prompt
+_MENU_INFO_PAGES: dict[str, Callable[[AppState, dict[str, str], TeeLogger], None]] = {
+    "7": improving_accuracy,
+    "8": show_de_reference,
+}
+
+
+def _run_pipeline(
+    steps: Iterable[Callable[[AppState, dict[str, str], TeeLogger], bool]],
+    state: AppState,
+    cfg: dict[str, str],
+    log: TeeLogger,
+) -> bool:
+    """Run workflow steps until one fails; on failure report the abort and wait for enter."""
+
+    for step in steps:
+        if not step(state, cfg, log):
+            log.writeln("")
+            log.writeln("Operation aborted.")
+            input("Press enter to return to main menu...")
+            return False
+    return True
 
-    for var in required_vars:
-        if not cfg.get(var, "").strip():
-            log.writeln(f"⚠️ Warning: Variable {var} not set. Check setup file.")
 
+def _menu_workflow(state: AppState, cfg: dict[str, str], log: TeeLogger) -> None:
+    """Main menu actions 1-5: run the workflow for state.action."""
+
+    ensure_runtime_ready(state.PLATFORM, log)
+    dialog_title = _MENU_DIALOG_TITLES.get(state.action)
+    if dialog_title:
+        state.dialog_title = dialog_title
+        log.writeln(dialog_title)
+    _run_pipeline(_MENU_PIPELINES[state.action], state, cfg, log)
+
+
+def _menu_setup(state: AppState, cfg: dict[str, str], log: TeeLogger) -> None:
+    """Main menu action 6: edit setup parameters."""
+
+    edit_setup_parameters(state, cfg, log)
+    # Edits may keep the file's size and mtime (coarse timestamps), so rebuild
+    state.setup_stamp = None
+
+
+def _menu_info_page(state: AppState, cfg: dict[str, str], log: TeeLogger) -> None:
+    """Main menu actions 7-8: show an info page."""
+
+    _MENU_INFO_PAGES[state.action](state, cfg, log)
+    input("Press enter to return to main menu...")
+
+
+def _menu_exit(state: AppState, cfg: dict[str, str], log: TeeLogger) -> None:
+    """Main menu action 9: exit the script."""
+
+    _ = (state, cfg)
+    log.writeln("")
+    log.writeln("Exiting script...")
+    raise SystemExit(0)
+
+
+# Main menu handlers indexed by ord(key) - ord("1")
+_MENU_HANDLERS: tuple[Callable[[AppState, dict[str, str], TeeLogger], None], ...] = (
+    *(_menu_workflow,) * 5,
+    _menu_setup,
+    _menu_info_page,
+    _menu_info_page,
+    _menu_exit,
+)
 
 
 def main_menu(state: AppState, cfg: dict[str, str], log: TeeLogger) -> None:
@@ -2319,7 +3057,20 @@ def main_menu(state: AppState, cfg: dict[str, str], log: TeeLogger) -> None:
     while True:
         cfg = load_setup_file_shell_style(state.setup_file)
 
-        validate_cfg_paths(cfg, log)
+        # Re-validate and rebuild the derived setup values only when the setup file
+        # changed; otherwise repeat the previous warnings
+        st = os.stat(state.setup_file)
+        setup_stamp = (st.st_mtime_ns, st.st_size)
+        if setup_stamp != state.setup_stamp:
+            state.setup_warnings = validate_cfg_paths(cfg, log)
+            resolve_cfg_folders(state, cfg)
+            state.selections = build_selection_table(cfg)
+            state.common_args = build_common_args(cfg)
+            state.target_cfg = make_target_cfg(cfg)
+            state.setup_stamp = setup_stamp
+        elif state.setup_warnings:
+            log.write_block(state.setup_warnings)
+        state.resolved_icc_paths.clear()
 
         # Clear variables each loop to mirror Bash behavior
         state.source_folder = ""
@@ -2328,184 +3079,83 @@ def main_menu(state: AppState, cfg: dict[str, str], log: TeeLogger) -> None:
         state.desc = ""
         state.action = ""
         state.profile_folder = ""
+        state.profile_folder_resolved = ""
         state.new_name = ""
         state.ti3_mtime_before = ""
         state.ti3_mtime_after = ""
 
-        log.writeln("")
-        log.writeln("")
-        log.writeln("─────────────────────────────────────────────────────────────────────────")
-        log.writeln("Printer Profiling — Main Menu")
-        log.writeln("─────────────────────────────────────────────────────────────────────────")
-        log.writeln("General Notes:")
-        log.writeln("   1. Existing ti1/ti2/ti3/icc and target image (.tif) filenames must match.")
-        log.writeln("   2. If more than one target image, filenames must end with _01, _02, etc.")
-        log.writeln("")
-        log.writeln("")
-        log.writeln("What action do you want to perform?")
-        log.writeln("")
-        log.writeln("1: Create target chart and printer profile from scratch")
-        log.writeln("    └─ Specify name → Generate targets → Measure target patches")
-        log.writeln("       → Create profile → Sanity check → Copy to profile folder")
-        log.writeln("       (Cancel after generating targets if only target chart is needed)")
-        log.writeln("")
-        log.writeln("2: Resume or re-read an existing target chart measurement and create profile")
-        log.writeln("    └─ Specify .ti3 file → Measure target patches")
-        log.writeln("       → Create profile → Sanity check → Copy to profile folder")
-        log.writeln("")
-        log.writeln("3: Read an existing target chart from scratch and create profile")
-        log.writeln("    └─ Specify .ti2 file → Measure target patches")
-        log.writeln("       → Create profile → Sanity check → Copy to profile folder")
-        log.writeln("")
-        log.writeln("4: Create printer profile from an existing measurement file")
-        log.writeln("    └─ Specify .ti3 file → Create profile → Sanity check")
-        log.writeln("       → Copy to profile folder")
-        log.writeln("")
-        log.writeln("5: Perform sanity check on existing profile")
-        log.writeln("    └─ Specify .ti3 file → Check profile against test chart data")
-        log.writeln("       → Create report")
-        log.writeln("")
-        log.writeln("6: Change setup parameters")
-        log.writeln("")
-        log.writeln("7: Show tips on how to improve accuracy of a profile")
-        log.writeln("")
-        log.writeln("8: Show ΔE2000 Color Accuracy — Quick Reference")
-        log.writeln("")
-        log.writeln("9: Exit script")
-        log.writeln("─────────────────────────────────────────────────────────────────────────")
-        log.writeln("")
+        log.write(_MAIN_MENU_TEXT)
 
-        print("Enter your choice [1–9]: ", end='', flush=True)
+        log.prompt("Enter your choice [1–9]: ")
         answer = getch()
-        print(answer, flush=True)
+        print(answer)
 
-        if answer == "1":
-            state.action = "1"
-            if not specify_profile_name(state, cfg, log):
-                log.writeln("")
-                log.writeln("Operation aborted.")
-                input("Press enter to return to main menu...")
-                continue
-            if not select_instrument(state, cfg, log):
-                log.writeln("")
-                log.writeln("Operation aborted.")
-                input("Press enter to return to main menu...")
-                continue
-            if not specify_and_generate_target(state, cfg, log):
-                log.writeln("")
-                log.writeln("Operation aborted.")
-                input("Press enter to return to main menu...")
-                continue
-            if not perform_measurement_and_profile_creation(state, cfg, log):
-                log.writeln("")
-                log.writeln("Operation aborted.")
-                input("Press enter to return to main menu...")
-                continue
-            if not install_profile_and_save_data(state, cfg, log):
-                log.writeln("")
-                log.writeln("Operation aborted.")
-                input("Press enter to return to main menu...")
-                continue
-
-        elif answer == "2":
-            state.action = "2"
-            state.dialog_title = "Select an existing .ti3 file to re-read/resume measuring target patches."
-            log.writeln(state.dialog_title)
-            if not select_file(state, cfg, log):
-                log.writeln("")
-                log.writeln("Operation aborted.")
-                input("Press enter to return to main menu...")
-                continue
-            if not perform_measurement_and_profile_creation(state, cfg, log):
-                log.writeln("")
-                log.writeln("Operation aborted.")
-                input("Press enter to return to main menu...")
-                continue
-            if not install_profile_and_save_data(state, cfg, log):
-                log.writeln("")
-                log.writeln("Operation aborted.")
-                input("Press enter to return to main menu...")
-                continue
-
-        elif answer == "3":
-            state.action = "3"
-            state.dialog_title = "Select an existing .ti2 file to measure target patches."
-            log.writeln(state.dialog_title)
-            if not select_file(state, cfg, log):
-                log.writeln("")
-                log.writeln("Operation aborted.")
-                input("Press enter to return to main menu...")
-                continue
-            if not perform_measurement_and_profile_creation(state, cfg, log):
-                log.writeln("")
-                log.writeln("Operation aborted.")
-                input("Press enter to return to main menu...")
-                continue
-            if not install_profile_and_save_data(state, cfg, log):
-                log.writeln("")
-                log.writeln("Operation aborted.")
-                input("Press enter to return to main menu...")
-                continue
+        index = ord(answer) - ord("1") if len(answer) == 1 else -1
+        if 0 <= index < len(_MENU_HANDLERS):
+            state.action = answer
+            _MENU_HANDLERS[index](state, cfg, log)
+        else:
+            log.writeln("")
+            log.writeln("No valid selection made. Returning to main menu...")
 
-        elif answer == "4":
-            state.action = "4"
-            state.dialog_title = "Select an existing completed .ti3 file to create .icc profile with."
-            log.writeln(state.dialog_title)
-            if not select_file(state, cfg, log):
-                log.writeln("")
-                log.writeln("Operation aborted.")
-                input("Press enter to return to main menu...")
-                continue
-            if not create_profile_from_existing(state, cfg, log):
-                log.writeln("")
-                log.writeln("Operation aborted.")
-                input("Press enter to return to main menu...")
-                continue
-            if not install_profile_and_save_data(state, cfg, log):
-                log.writeln("")
-                log.writeln("Operation aborted.")
-                input("Press enter to return to main menu...")
-                continue
 
-        elif answer == "5":
-            state.action = "5"
-            state.dialog_title = "Select an existing .ti3 file that has a matching .icc profile."
-            log.writeln(state.dialog_title)
-            if not select_file(state, cfg, log):
-                log.writeln("")
-                log.writeln("Operation aborted.")
-                input("Press enter to return to main menu...")
-                continue
-            if not sanity_check(state, cfg, log):
-                log.writeln("")
-                log.writeln("Operation aborted.")
-                input("Press enter to return to main menu...")
-                continue
+def _argyll_version() -> str:
+    """Return the ArgyllCMS version from dispcal's usage text ("unknown" if not found)."""
 
-        elif answer == "6":
-            state.action = "6"
-            edit_setup_parameters(state, cfg, log)
+    # Only the first line of dispcal's usage text is needed, so stop reading there
+    # and end the process instead of capturing all of its output.
+    try:
+        proc = subprocess.Popen(
+            ["dispcal"], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, errors="replace"
+        )
+        assert proc.stdout is not None
+        try:
+            argyll_version_line = proc.stdout.readline(4096)
+        finally:
+            proc.stdout.close()
+            if proc.poll() is None:
+                proc.kill()  # Only printing usage text, nothing to clean up
+            proc.wait()
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+    match = _ARGYLL_VER_RE.search(argyll_version_line)
+    return match.group(1) if match else "unknown"
+
+
+@functools.lru_cache(maxsize=1)
+def ensure_runtime_ready(PLATFORM: str, log: TeeLogger) -> None:
+    """Check the file dialog prerequisites and log the Argyll version (once per session).
+
+    Called before the first main menu action that runs Argyll tools or opens a file
+    dialog, so the info pages and exit never import tkinter or start dispcal.
+    """
 
-        elif answer == "7":
-            state.action = "7"
-            improving_accuracy(state, cfg, log)
-            input("Press enter to return to main menu...")
+    # The tkinter import and the dispcal version probe are independent, so the
+    # probe runs in the background; results are reported in the original order.
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        version_future = ex.submit(_argyll_version)
 
-        elif answer == "8":
-            state.action = "8"
-            show_de_reference(state, cfg, log)
-            input("Press enter to return to main menu...")
+        # Check tkinter availability for file dialogs
+        try:
+            import tkinter
+        except ImportError:
+            log.writeln("❌ tkinter is required for file selection dialogs but is not available in this Python installation.")
+            hint = _PLATFORM_HINTS["tkinter"].get(PLATFORM)
+            if hint:
+                log.writeln(hint)
+            raise SystemExit(1)
 
-        elif answer == "9":
-            state.action = "9"
-            log.writeln("")
-            log.writeln("Exiting script...")
-            raise SystemExit(0)
+        # Check Linux window management tools for focus return
+        if PLATFORM == "linux":
+            wm_tools = _linux_wm_tools()
+            if not wm_tools["xdotool"] and not wm_tools["wmctrl"]:
+                log.writeln("❌ On Linux, window management tools are required for file dialog focus return but neither xdotool nor wmctrl is available.")
+                log.writeln("Install xdotool with: sudo apt update && sudo apt install xdotool")
+                log.writeln("Or install wmctrl with: sudo apt update && sudo apt install wmctrl")
+                raise SystemExit(1)
 
-        else:
-            log.writeln("")
-            log.writeln("No valid selection made. Returning to main menu...")
-            continue
+        # Extract Argyll version for logging
+        log.writeln(f"ArgyllCMS version: {version_future.result()}")
 
 
 def main() -> None:
@@ -2522,17 +3172,14 @@ def main() -> None:
     temp_log = script_dir / f"Argyll_Printer_Profiler_{today}.log"
     setup_file = script_dir / "Argyll_Printer_Profiler_setup.ini"
 
-    # Ensure the log file exists and is writable
+    # Create logger that writes to both terminal and log file. Opening the log for
+    # appending creates it if needed; its folder is script_dir, which always exists.
     try:
-        temp_log.parent.mkdir(parents=True, exist_ok=True)
-        temp_log.touch(exist_ok=True)
+        log = TeeLogger(temp_log)
     except OSError as e:
         print(f"❌ Cannot create log file at '{temp_log}': {e}")
         raise SystemExit(1)
 
-    # Create logger that writes to both terminal and log file
-    log = TeeLogger(temp_log)
-
     # Create application state object
     state = AppState(
         script_dir=script_dir,
@@ -2547,6 +3194,7 @@ def main() -> None:
 
     # Add session separator to log only
     session_separator(state, log)
+    log.flush()
 
     # Load setup configuration from file
     if not setup_file.exists():
@@ -2556,41 +3204,10 @@ def main() -> None:
 
     cfg = load_setup_file_shell_style(setup_file)
 
-    # Check that required Argyll commands are available
-    required_cmds = ["targen", "chartread", "colprof", "printtarg", "profcheck", "dispcal"]
-    check_required_commands(required_cmds, log, PLATFORM)
-
-    # Check tkinter availability for file dialogs
-    try:
-        import tkinter
-    except ImportError:
-        log.writeln("❌ tkinter is required for file selection dialogs but is not available in this Python installation.")
-        if PLATFORM == "linux":
-            log.writeln("On Linux, install tkinter with: sudo apt update && sudo apt install python3-tk")
-        elif PLATFORM == "macos":
-            log.writeln("On macOS, tkinter is usually included with Python. Try reinstalling Python from python.org or use Homebrew: brew install python-tk")
-        elif PLATFORM == "windows":
-            log.writeln("On Windows, tkinter is included with Python installations from python.org. Download and install Python again, ensuring tkinter is selected during installation.")
-        raise SystemExit(1)
-
-    # Check Linux window management tools for focus return
-    if PLATFORM == "linux":
-        if not shutil.which("xdotool") and not shutil.which("wmctrl"):
-            log.writeln("❌ On Linux, window management tools are required for file dialog focus return but neither xdotool nor wmctrl is available.")
-            log.writeln("Install xdotool with: sudo apt update && sudo apt install xdotool")
-            log.writeln("Or install wmctrl with: sudo apt update && sudo apt install wmctrl")
-            raise SystemExit(1)
-
-    # Extract Argyll version for logging
-    try:
-        result = subprocess.run(["dispcal"], capture_output=True, text=True)
-        argyll_version_line = (result.stdout + result.stderr).split('\n')[0]
-        match = re.search(r'Version ([0-9.]+)', argyll_version_line)
-        argyll_version = match.group(1) if match else "unknown"
-    except (subprocess.SubprocessError, AttributeError):
-        argyll_version = "unknown"
+    # Check that required Argyll commands are available (the GUI checks and the
+    # version probe wait for the first action that needs them, see ensure_runtime_ready())
+    check_required_commands(_ARGYLL_CMDS, log, PLATFORM)
     log.writeln("✅ ArgyllCMS detected")
-    log.writeln(f"   Version: {argyll_version}")
     log.writeln("")
     log.writeln("🖥️  Recommended Terminal Window Size: 100 columns x 50 rows")
     log.writeln("")